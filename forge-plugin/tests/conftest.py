@@ -3,13 +3,24 @@
 Provides:
 - FORGE_DIR resolution (absolute path to forge-plugin/)
 - YAML frontmatter extraction helper
-- Common path constants
+- JSON loading helper (orjson when installed, stdlib json otherwise)
+- Common path constants, the shared SEMVER_PATTERN, HOOK_SCRIPT_RE and
+  EXPECTED_COMMANDS
+
+Both parsing helpers memoize their results per ``(path, mtime_ns, size)`` in a
+bounded LRU, so that a file shared by several test modules is only read and
+parsed once per session. The memo is meant for repository files that do not
+change during a run: mtime comes from a coarse clock, so a file rewritten
+with the same size within one tick may return the earlier result. Callers
+must treat the returned objects as read-only.
 """
 
+import functools
 import os
 import re
 import sys
 from pathlib import Path
+from typing import Any
 
 import pytest
 
@@ -48,6 +59,49 @@ FORGE_DIR = _resolve_forge_dir()
 REPO_ROOT = FORGE_DIR.parent
 """Absolute path to the repository root."""
 
+SEMVER_PATTERN = re.compile(r"^\d+\.\d+\.\d+(-[a-zA-Z0-9]+(\.[a-zA-Z0-9]+)*)?$")
+"""Semantic version: MAJOR.MINOR.PATCH with an optional pre-release suffix."""
+
+HOOK_SCRIPT_RE = re.compile(r"hooks/([a-z_]+\.sh)")
+"""Script name in a hook command like ``bash "${CLAUDE_PLUGIN_ROOT}/hooks/name.sh"``."""
+
+EXPECTED_COMMANDS = frozenset({
+    "analyze", "implement", "improve", "document", "test", "build",
+    "brainstorm", "remember", "mock", "azure-pipeline", "etl-pipeline",
+    "azure-function",
+})
+"""Slash commands the plugin must ship (one commands/{name}.md each)."""
+
+EXPECTED_COMMANDS_SORTED = tuple(sorted(EXPECTED_COMMANDS))
+"""EXPECTED_COMMANDS in a stable order, for parametrize and loops."""
+
+_CacheKey = tuple[str, int, int]
+
+# In-process memo size; comfortably above the ~600 .md/.json files in the tree
+_MEMO_SIZE = 2048
+
+# Frontmatter sits at the top of the file and is usually well under 2 KB
+_FRONTMATTER_CHUNK = 4096
+# Give up past this: a leading --- with no close is a thematic break, not frontmatter
+_FRONTMATTER_MAX = 64 * 1024
+
+
+def _cache_key(filepath: Path) -> _CacheKey:
+    """Return the memoization key for a file: its path, mtime in ns and size."""
+    st = filepath.stat()
+    return str(filepath), st.st_mtime_ns, st.st_size
+
+
+def _cached_parse(filepath: Path, parser) -> Any:
+    """Return ``parser(filepath)``, memoized on the file's path, mtime and size."""
+    return _parse_once(parser, _cache_key(filepath))
+
+
+@functools.lru_cache(maxsize=_MEMO_SIZE)
+def _parse_once(parser, key: _CacheKey) -> Any:
+    """Parse the file behind ``key`` (one entry per parser and file version)."""
+    return parser(Path(key[0]))
+
 
 def extract_yaml_frontmatter(filepath: Path) -> dict | None:
     """Extract YAML frontmatter from a markdown file.
@@ -55,34 +109,113 @@ def extract_yaml_frontmatter(filepath: Path) -> dict | None:
     Expects frontmatter delimited by --- at the top of the file.
     Returns parsed dict or None if no frontmatter found.
     """
+    return _cached_parse(filepath, _parse_yaml_frontmatter)
+
+
+def _parse_yaml_frontmatter(filepath: Path) -> dict | None:
+    """Read and parse the frontmatter of ``filepath`` (uncached).
+
+    Only the head of the file, up to the closing ``---`` (at most
+    ``_FRONTMATTER_MAX`` bytes), is read. Parsing
+    uses libyaml's CSafeLoader when PyYAML was built with it.
+    """
     import yaml
 
-    text = filepath.read_text(encoding="utf-8")
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
-    # Must start with ---
-    if not text.startswith("---"):
-        return None
+    with open(filepath, "rb") as f:
+        head = f.read(_FRONTMATTER_CHUNK)
 
-    # Find closing ---
-    end = text.find("---", 3)
-    if end == -1:
-        return None
+        # Must start with ---
+        if not head.startswith(b"---"):
+            return None
+
+        # Find closing ---, reading further only while it has not been seen
+        end = head.find(b"---", 3)
+        while end == -1:
+            chunk = f.read(_FRONTMATTER_CHUNK)
+            if not chunk or len(head) >= _FRONTMATTER_MAX:
+                return None
+            start = max(3, len(head) - 2)
+            head += chunk
+            end = head.find(b"---", start)
 
-    frontmatter_text = text[3:end].strip()
+    frontmatter_text = head[3:end].decode("utf-8").strip()
     if not frontmatter_text:
         return None
 
     try:
-        return yaml.safe_load(frontmatter_text)
+        return yaml.load(frontmatter_text, Loader=loader)
     except yaml.YAMLError:
         return None
 
 
 def load_json(filepath: Path) -> dict:
     """Load and parse a JSON file."""
-    import json
+    return _cached_parse(filepath, _parse_json)
+
+
+def _parse_json(filepath: Path) -> Any:
+    """Read and parse ``filepath`` (uncached).
+
+    Uses orjson when installed; it returns the same plain dict/list/str/
+    int/float/bool/None objects as the stdlib parser, and its decode error
+    subclasses ``json.JSONDecodeError``.
+    """
+    try:
+        import orjson
+    except ImportError:
+        import json
+
+        return json.loads(filepath.read_text(encoding="utf-8"))
+    return orjson.loads(filepath.read_bytes())
 
-    return json.loads(filepath.read_text(encoding="utf-8"))
+
+def scan_tree(root: Path) -> dict[str, frozenset[str]]:
+    """Snapshot a directory tree with one recursive ``os.scandir`` walk.
+
+    Returns ``{"dirs": ..., "files": ...}`` holding paths relative to ``root``
+    as POSIX strings, so existence checks become set lookups. DirEntry type
+    checks reuse the information returned by the directory listing.
+    """
+    dirs: set[str] = set()
+    files: set[str] = set()
+    stack = [(root, "")]
+    while stack:
+        path, prefix = stack.pop()
+        with os.scandir(path) as it:
+            for entry in it:
+                rel = prefix + entry.name
+                if entry.is_dir():
+                    dirs.add(rel)
+                    stack.append((entry.path, rel + "/"))
+                elif entry.is_file():
+                    files.add(rel)
+    return {"dirs": frozenset(dirs), "files": frozenset(files)}
+
+
+# Pytest hooks
+
+
+def pytest_configure(config) -> None:
+    """Refuse to run without libyaml when ``FORGE_REQUIRE_LIBYAML=1`` (set in CI).
+
+    Otherwise frontmatter parsing would silently fall back to the much slower
+    pure-Python loader.
+    """
+    import yaml
+
+    if os.environ.get("FORGE_REQUIRE_LIBYAML") == "1" and not hasattr(yaml, "CSafeLoader"):
+        raise pytest.UsageError("FORGE_REQUIRE_LIBYAML=1 but PyYAML was built without libyaml")
+
+
+def pytest_report_header(config) -> str:
+    """Report which YAML loader frontmatter parsing uses."""
+    import yaml
+
+    if hasattr(yaml, "CSafeLoader"):
+        return "forge: YAML frontmatter loader: CSafeLoader (libyaml)"
+    return "forge: YAML frontmatter loader: SafeLoader (pure Python, libyaml not available)"
 
 
 # Pytest fixtures available to all tests
@@ -98,3 +231,76 @@ def forge_dir() -> Path:
 def repo_root() -> Path:
     """Provide the repository root path."""
     return REPO_ROOT
+
+
+# Parsed JSON files shared across test modules. Session-scoped: these files
+# do not change during a run, so each is loaded exactly once.
+
+
+@pytest.fixture(scope="session")
+def agent_config_schema() -> dict:
+    """Provide interfaces/schemas/agent_config.schema.json."""
+    schema_path = FORGE_DIR / "interfaces" / "schemas" / "agent_config.schema.json"
+    assert schema_path.exists(), f"Schema not found: {schema_path}"
+    return load_json(schema_path)
+
+
+@pytest.fixture(scope="session")
+def context_metadata_validator():
+    """Provide a validator for interfaces/schemas/context_metadata.schema.json.
+
+    jsonschema.validate() re-checks the schema and builds a new validator on
+    every call; this one is checked and built once per session.
+    """
+    from jsonschema.validators import validator_for
+
+    schema_path = FORGE_DIR / "interfaces" / "schemas" / "context_metadata.schema.json"
+    assert schema_path.exists(), f"Schema not found: {schema_path}"
+    schema = load_json(schema_path)
+    validator_cls = validator_for(schema)
+    validator_cls.check_schema(schema)
+    return validator_cls(schema)
+
+
+@pytest.fixture(scope="session")
+def hooks_data() -> dict:
+    """Provide hooks/hooks.json."""
+    hooks_path = FORGE_DIR / "hooks" / "hooks.json"
+    assert hooks_path.exists(), "hooks.json not found"
+    return load_json(hooks_path)
+
+
+@pytest.fixture(scope="session")
+def plugin_data() -> dict:
+    """Provide .claude-plugin/plugin.json."""
+    plugin_path = FORGE_DIR / ".claude-plugin" / "plugin.json"
+    assert plugin_path.exists(), "plugin.json not found at .claude-plugin/plugin.json"
+    return load_json(plugin_path)
+
+
+@pytest.fixture(scope="session")
+def safety_data() -> dict:
+    """Provide templates/root_safety_profile.json."""
+    safety_path = FORGE_DIR / "templates" / "root_safety_profile.json"
+    assert safety_path.exists(), "root_safety_profile.json not found"
+    return load_json(safety_path)
+
+
+@pytest.fixture(scope="session")
+def conflicts_data() -> dict:
+    """Provide hooks/lib/framework_conflicts.json."""
+    conflicts_path = FORGE_DIR / "hooks" / "lib" / "framework_conflicts.json"
+    assert conflicts_path.exists(), "framework_conflicts.json not found"
+    return load_json(conflicts_path)
+
+
+@pytest.fixture(scope="session")
+def commands_tree() -> dict[str, frozenset[str]]:
+    """Provide a scan_tree() snapshot of commands/."""
+    return scan_tree(FORGE_DIR / "commands")
+
+
+@pytest.fixture(scope="session")
+def context_tree() -> dict[str, frozenset[str]]:
+    """Provide a scan_tree() snapshot of context/."""
+    return scan_tree(FORGE_DIR / "context")
@@ -14,13 +14,11 @@ Migrated from .github/workflows/forge-agent-validator.md as part of Phase 2 opti
 
 import json
 import re
-import sys
 from pathlib import Path
 
 import pytest
 from jsonschema import validate, ValidationError
 
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 from conftest import FORGE_DIR, load_json
 
 
@@ -11,6 +11,7 @@ Validates:
 Phase 1 of the Forge Testing Architecture.
 """
 
+import functools
 import re
 import sys
 from pathlib import Path
@@ -48,6 +49,17 @@ MANDATORY_SECTIONS = [
 ]
 
 
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+@functools.lru_cache(maxsize=None)
+def _read_text(path: Path) -> str:
+    """Read a skill file once; several test classes check the same files."""
+    return path.read_text(encoding="utf-8")
+
+
 # ---------------------------------------------------------------------------
 # Skill File Structure Tests
 # ---------------------------------------------------------------------------
@@ -198,7 +210,7 @@ class TestArchitectureSkillContent:
     def test_interface_references_present(self, skill_name):
         """SKILL.md must reference ContextProvider and MemoryStore interfaces."""
         skill_md = FORGE_DIR / "skills" / skill_name / "SKILL.md"
-        content = skill_md.read_text(encoding="utf-8")
+        content = _read_text(skill_md)
         for ref in INTERFACE_REFERENCES:
             assert ref in content, (
                 f"Skill '{skill_name}' missing interface reference: {ref}"
@@ -208,7 +220,7 @@ class TestArchitectureSkillContent:
     def test_mandatory_sections_present(self, skill_name):
         """SKILL.md must contain Mandatory Workflow, Compliance Checklist, Version History."""
         skill_md = FORGE_DIR / "skills" / skill_name / "SKILL.md"
-        content = skill_md.read_text(encoding="utf-8").lower()
+        content = _read_text(skill_md).lower()
         for section in MANDATORY_SECTIONS:
             assert section.lower() in content, (
                 f"Skill '{skill_name}' missing section: {section}"
@@ -218,7 +230,7 @@ class TestArchitectureSkillContent:
     def test_no_hardcoded_filesystem_paths(self, skill_name):
         """SKILL.md must not contain hardcoded absolute filesystem paths."""
         skill_md = FORGE_DIR / "skills" / skill_name / "SKILL.md"
-        content = skill_md.read_text(encoding="utf-8")
+        content = _read_text(skill_md)
         # Check for absolute paths that suggest hardcoded filesystem references
         hardcoded_patterns = [
             r"/home/\w+/",
@@ -235,7 +247,7 @@ class TestArchitectureSkillContent:
     def test_memory_store_usage(self, skill_name):
         """SKILL.md must reference memoryStore for memory operations."""
         skill_md = FORGE_DIR / "skills" / skill_name / "SKILL.md"
-        content = skill_md.read_text(encoding="utf-8")
+        content = _read_text(skill_md)
         assert "memoryStore" in content, (
             f"Skill '{skill_name}' does not reference memoryStore interface"
         )
@@ -244,7 +256,7 @@ class TestArchitectureSkillContent:
     def test_output_convention_reference(self, skill_name):
         """SKILL.md must reference the output conventions for report routing."""
         skill_md = FORGE_DIR / "skills" / skill_name / "SKILL.md"
-        content = skill_md.read_text(encoding="utf-8")
+        content = _read_text(skill_md)
         assert "/claudedocs/" in content, (
             f"Skill '{skill_name}' does not reference /claudedocs/ output directory"
         )
@@ -253,7 +265,7 @@ class TestArchitectureSkillContent:
     def test_workflow_steps_ordered(self, skill_name):
         """SKILL.md must have numbered workflow steps in ascending order."""
         skill_md = FORGE_DIR / "skills" / skill_name / "SKILL.md"
-        content = skill_md.read_text(encoding="utf-8")
+        content = _read_text(skill_md)
         step_numbers = re.findall(r"###\s+Step\s+(\d+)", content)
         assert len(step_numbers) >= 5, (
             f"Skill '{skill_name}' must have at least 5 workflow steps, found {len(step_numbers)}"
@@ -277,7 +289,7 @@ class TestArchitectureSkillExamples:
     def test_examples_has_minimum_scenarios(self, skill_name):
         """examples.md must contain at least 3 distinct examples."""
         examples_md = FORGE_DIR / "skills" / skill_name / "examples.md"
-        content = examples_md.read_text(encoding="utf-8")
+        content = _read_text(examples_md)
         example_count = len(re.findall(r"##\s+Example\s+\d+", content))
         assert example_count >= 3, (
             f"Skill '{skill_name}' examples.md has {example_count} examples, need at least 3"
@@ -287,7 +299,7 @@ class TestArchitectureSkillExamples:
     def test_examples_have_scenarios(self, skill_name):
         """Each example must have a Scenario section."""
         examples_md = FORGE_DIR / "skills" / skill_name / "examples.md"
-        content = examples_md.read_text(encoding="utf-8")
+        content = _read_text(examples_md)
         scenario_count = len(re.findall(r"###\s+Scenario", content))
         example_count = len(re.findall(r"##\s+Example\s+\d+", content))
         assert scenario_count >= example_count, (
@@ -299,7 +311,7 @@ class TestArchitectureSkillExamples:
     def test_examples_have_user_prompts(self, skill_name):
         """Each example must include a User Prompt."""
         examples_md = FORGE_DIR / "skills" / skill_name / "examples.md"
-        content = examples_md.read_text(encoding="utf-8")
+        content = _read_text(examples_md)
         prompt_count = len(re.findall(r"###\s+User Prompt", content))
         assert prompt_count >= 3, (
             f"Skill '{skill_name}' examples has {prompt_count} User Prompts, need at least 3"
@@ -318,7 +330,7 @@ class TestArchitectureSkillMemory:
     def test_memory_index_references_skill(self, skill_name):
         """Memory index must reference the parent skill."""
         index_md = FORGE_DIR / "memory" / "skills" / skill_name / "index.md"
-        content = index_md.read_text(encoding="utf-8")
+        content = _read_text(index_md)
         assert skill_name in content, (
             f"Memory index for '{skill_name}' does not reference the skill name"
         )
@@ -327,7 +339,7 @@ class TestArchitectureSkillMemory:
     def test_memory_index_has_purpose(self, skill_name):
         """Memory index must have a Purpose section."""
         index_md = FORGE_DIR / "memory" / "skills" / skill_name / "index.md"
-        content = index_md.read_text(encoding="utf-8")
+        content = _read_text(index_md)
         assert "## Purpose" in content, (
             f"Memory index for '{skill_name}' missing Purpose section"
         )
@@ -336,7 +348,7 @@ class TestArchitectureSkillMemory:
     def test_memory_index_has_file_definitions(self, skill_name):
         """Memory index must define required memory files."""
         index_md = FORGE_DIR / "memory" / "skills" / skill_name / "index.md"
-        content = index_md.read_text(encoding="utf-8")
+        content = _read_text(index_md)
         assert "project_overview.md" in content, (
             f"Memory index for '{skill_name}' missing project_overview.md definition"
         )
@@ -354,7 +366,7 @@ class TestArchitectureSkillCrossReferences:
     def test_skill_references_shared_loading_patterns(self, skill_name):
         """SKILL.md must reference shared loading patterns."""
         skill_md = FORGE_DIR / "skills" / skill_name / "SKILL.md"
-        content = skill_md.read_text(encoding="utf-8")
+        content = _read_text(skill_md)
         assert "shared_loading_patterns" in content.lower() or "Shared Loading Patterns" in content, (
             f"Skill '{skill_name}' missing reference to shared loading patterns"
         )
@@ -9,14 +9,13 @@ Validates:
 Migrated from .github/workflows/forge-context-pruner.md as part of Phase 2 optimization.
 """
 
+import posixpath
 import re
-import sys
 from pathlib import Path
 
 import pytest
 import yaml
 
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 from conftest import FORGE_DIR, extract_yaml_frontmatter
 
 
@@ -163,7 +162,7 @@ class TestContextIndexIntegrity:
         _get_domain_directories(),
         ids=[domain for domain, _ in _get_domain_directories()],
     )
-    def test_no_orphaned_references(self, domain, domain_dir):
+    def test_no_orphaned_references(self, domain, domain_dir, context_tree):
         """Check 3: No orphaned references - all files in index exist."""
         index_path = domain_dir / "index.md"
         
@@ -173,9 +172,14 @@ class TestContextIndexIntegrity:
         referenced_files = _parse_index_references(index_path)
         orphans = []
         
+        # Set lookups against the context/ snapshot; stat only refs that leave context/
         for ref in referenced_files:
-            ref_path = domain_dir / ref
-            if not ref_path.exists():
+            target = posixpath.normpath(f"{domain}/{ref}")
+            if target.partition("/")[0] == "..":
+                exists = (domain_dir / ref).exists()
+            else:
+                exists = target in context_tree["files"] or target in context_tree["dirs"]
+            if not exists:
                 orphans.append(ref)
         
         assert not orphans, (
@@ -10,13 +10,13 @@ Validates:
 Migrated from .github/workflows/forge-convention-enforcer.md as part of Phase 2 optimization.
 """
 
+import itertools
+import os
 import re
-import sys
 from pathlib import Path
 
 import pytest
 
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 from conftest import FORGE_DIR, extract_yaml_frontmatter
 
 
@@ -26,6 +26,22 @@ from conftest import FORGE_DIR, extract_yaml_frontmatter
 
 KEBAB_CASE_PATTERN = re.compile(r'^[a-z0-9]+(-[a-z0-9]+)*$')
 
+# Patterns that are potentially destructive in hook scripts (only checked in
+# actual code, not comments)
+UNSAFE_HOOK_PATTERNS = [
+    (r'^\s*rm\s+-rf\s+/', "rm -rf / (recursive delete from root)"),
+    (r'^\s*:\s*>\s*[^>]', ": > file (file truncation without safeguards)"),
+    (r'^\s*dd\s+if=.*of=/dev/', "dd to block device"),
+]
+
+# All unsafe patterns as one alternation; group p<i> is UNSAFE_HOOK_PATTERNS[i].
+# Every pattern is anchored at a line start and a line matches at most one
+# of them, so a single finditer pass sees every hit.
+UNSAFE_HOOK_RE = re.compile(
+    "|".join(f"(?P<p{i}>{pattern})" for i, (pattern, _) in enumerate(UNSAFE_HOOK_PATTERNS)),
+    re.MULTILINE,
+)
+
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -88,12 +104,14 @@ def _get_hook_scripts() -> list[tuple[str, Path]]:
 def _get_markdown_files() -> list[tuple[str, Path]]:
     """Get all markdown files in forge-plugin/."""
     md_files = []
-    for md_path in sorted(FORGE_DIR.rglob("*.md")):
-        # Skip vendor directories and caches
-        if any(part.startswith('.') or part == '__pycache__' for part in md_path.parts):
-            continue
-        rel_path = md_path.relative_to(FORGE_DIR)
-        md_files.append((str(rel_path), md_path))
+    for root, dirs, files in os.walk(FORGE_DIR):
+        # Skip vendor directories and caches before descending into them
+        dirs[:] = [d for d in dirs if not d.startswith('.') and d != '__pycache__']
+        for name in files:
+            if name.endswith('.md') and not name.startswith('.'):
+                md_path = Path(root, name)
+                md_files.append((str(md_path.relative_to(FORGE_DIR)), md_path))
+    md_files.sort(key=lambda item: item[1])
     return md_files
 
 
@@ -246,29 +264,25 @@ class TestHookScriptStandards:
         # Remove lines starting with # (comments)
         lines = []
         for line in content.split('\n'):
-            # Skip comment lines
-            if line.strip().startswith('#'):
-                continue
-            # Remove inline comments (but be careful with strings)
-            # This is simplified - just check if line has actual commands
-            if not line.strip():
+            # Skip blank and comment lines; one lstrip and a first-character
+            # test instead of stripping the line twice
+            # (Inline comments are left in place - this just checks that the
+            # line has actual commands)
+            stripped = line.lstrip()
+            if not stripped or stripped[0] == '#':
                 continue
             lines.append(line)
         
         filtered_content = '\n'.join(lines)
         
-        # Patterns that are potentially destructive (only check in actual code)
-        unsafe_patterns = [
-            (r'^\s*rm\s+-rf\s+/', "rm -rf / (recursive delete from root)"),
-            (r'^\s*:\s*>\s*[^>]', ": > file (file truncation without safeguards)"),
-            (r'^\s*dd\s+if=.*of=/dev/', "dd to block device"),
+        # One scan over the code; each match's group names the pattern hit
+        found = {m.lastgroup for m in UNSAFE_HOOK_RE.finditer(filtered_content)}
+        violations = [
+            description
+            for i, (_, description) in enumerate(UNSAFE_HOOK_PATTERNS)
+            if f"p{i}" in found
         ]
         
-        violations = []
-        for pattern, description in unsafe_patterns:
-            if re.search(pattern, filtered_content, re.MULTILINE):
-                violations.append(description)
-        
         assert not violations, (
             f"Hook '{hook_name}' contains potentially unsafe patterns:\n  " +
             "\n  ".join(violations)
@@ -285,54 +299,52 @@ class TestMarkdownConventions:
     )
     def test_markdown_uses_atx_headings(self, rel_path, md_path):
         """Markdown files should use ATX-style headings (# ## ###) not Setext (=== ---)."""
-        content = md_path.read_text(encoding='utf-8')
-        
         # Check for Setext-style headings: text line followed by === or ---
-        # Split into lines and check for the pattern
-        lines = content.split('\n')
+        # Stream (line, next line) pairs instead of loading and splitting
+        # the whole file
         setext_found = False
         in_code_block = False
         in_frontmatter = False
         
-        for i in range(len(lines) - 1):
-            line = lines[i]
-            current_line = line.strip()
-            next_line = lines[i + 1].strip()
-            
-            # Track frontmatter (starts with --- on line 0, ends with next ---)
-            if i == 0 and current_line == '---':
-                in_frontmatter = True
-                continue
-            if in_frontmatter and current_line == '---':
-                in_frontmatter = False
-                continue
-            if in_frontmatter:
-                continue
-            
-            # Track code blocks
-            if current_line.startswith('```'):
-                in_code_block = not in_code_block
-                continue
-            
-            # Skip if in code block
-            if in_code_block:
-                continue
-            
-            # Skip empty lines, horizontal rules, indented lines, list items
-            if (not current_line or 
-                current_line == '---' or 
-                line.startswith('  ') or 
-                line.startswith('\t') or
-                current_line.startswith('-') or
-                current_line.startswith('*') or
-                current_line.startswith('+')):
-                continue
-            
-            # Check if next line is all === or all --- (Setext underline)
-            if re.match(r'^[=]{3,}$', next_line) or re.match(r'^[-]{3,}$', next_line):
-                # This looks like a Setext heading
-                setext_found = True
-                break
+        with md_path.open(encoding='utf-8') as f:
+            for i, (line, next_raw) in enumerate(itertools.pairwise(f)):
+                current_line = line.strip()
+                next_line = next_raw.strip()
+                
+                # Track frontmatter (starts with --- on line 0, ends with next ---)
+                if i == 0 and current_line == '---':
+                    in_frontmatter = True
+                    continue
+                if in_frontmatter and current_line == '---':
+                    in_frontmatter = False
+                    continue
+                if in_frontmatter:
+                    continue
+                
+                # Track code blocks
+                if current_line.startswith('```'):
+                    in_code_block = not in_code_block
+                    continue
+                
+                # Skip if in code block
+                if in_code_block:
+                    continue
+                
+                # Skip empty lines, horizontal rules, indented lines, list items
+                if (not current_line or 
+                    current_line == '---' or 
+                    line.startswith('  ') or 
+                    line.startswith('\t') or
+                    current_line.startswith('-') or
+                    current_line.startswith('*') or
+                    current_line.startswith('+')):
+                    continue
+                
+                # Check if next line is all === or all --- (Setext underline)
+                if re.match(r'^[=]{3,}$', next_line) or re.match(r'^[-]{3,}$', next_line):
+                    # This looks like a Setext heading
+                    setext_found = True
+                    break
         
         if setext_found:
             pytest.fail(
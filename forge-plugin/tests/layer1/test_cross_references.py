@@ -12,15 +12,23 @@ Validates:
 Phase 2 of the Forge Testing Architecture.
 """
 
+import functools
 import json
-import re
+import os
 import sys
 from pathlib import Path
 
 import pytest
 
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
-from conftest import FORGE_DIR, REPO_ROOT, extract_yaml_frontmatter, load_json
+from conftest import (
+    EXPECTED_COMMANDS_SORTED,
+    FORGE_DIR,
+    HOOK_SCRIPT_RE,
+    REPO_ROOT,
+    extract_yaml_frontmatter,
+    load_json,
+)
 
 
 # ---------------------------------------------------------------------------
@@ -38,6 +46,12 @@ VALID_DOMAINS = {
 # ---------------------------------------------------------------------------
 
 
+@functools.lru_cache(maxsize=4096)
+def _path_exists(base: Path, target: str) -> bool:
+    """Return whether base/target exists; cached, as agents and context files share targets."""
+    return (base / target).exists()
+
+
 def _get_agent_configs() -> list[tuple[str, Path]]:
     """Return (agent_name, config_path) for all agent configs."""
     agents_dir = FORGE_DIR / "agents"
@@ -56,6 +70,13 @@ def _get_domain_context_files() -> list[tuple[str, Path]]:
     return files
 
 
+@pytest.fixture(scope="module")
+def skill_names() -> frozenset[str]:
+    """Names of the directories under skills/, from a single scandir."""
+    with os.scandir(FORGE_DIR / "skills") as it:
+        return frozenset(e.name for e in it if e.is_dir())
+
+
 # ---------------------------------------------------------------------------
 # Agent Config → Skill Cross-References
 # ---------------------------------------------------------------------------
@@ -69,14 +90,13 @@ class TestAgentSkillReferences:
         _get_agent_configs(),
         ids=[name for name, _ in _get_agent_configs()],
     )
-    def test_agent_skills_exist(self, agent_name, config_path):
+    def test_agent_skills_exist(self, agent_name, config_path, skill_names):
         """Every skill in an agent's skills[] must have a corresponding directory."""
         config = load_json(config_path)
         skills = config.get("skills", [])
         for skill_entry in skills:
             skill_name = skill_entry.get("name", "")
-            skill_dir = FORGE_DIR / "skills" / skill_name
-            assert skill_dir.is_dir(), (
+            assert skill_name in skill_names, (
                 f"Agent '{agent_name}' references skill '{skill_name}' "
                 f"but directory skills/{skill_name}/ does not exist"
             )
@@ -158,10 +178,7 @@ class TestAgentAlwaysLoadFiles:
         files = config.get("context", {}).get("alwaysLoadFiles", [])
         for filepath in files:
             # Paths are relative to forge-plugin/ or repo root
-            resolved = FORGE_DIR / filepath
-            if not resolved.exists():
-                resolved = REPO_ROOT / filepath
-            assert resolved.exists(), (
+            assert _path_exists(FORGE_DIR, filepath) or _path_exists(REPO_ROOT, filepath), (
                 f"Agent '{agent_name}' alwaysLoadFiles '{filepath}' "
                 f"does not exist"
             )
@@ -221,10 +238,9 @@ class TestCrossDomainTriggers:
             parts = trigger.split("/", 1)
             if len(parts) == 2:
                 domain, filename = parts
-                target = context_dir / domain / f"{filename}.md"
-                assert target.exists(), (
+                assert _path_exists(context_dir, f"{domain}/{filename}.md"), (
                     f"{rel_path}: crossDomainTrigger '{trigger}' → "
-                    f"{target.relative_to(FORGE_DIR)} does not exist"
+                    f"context/{domain}/{filename}.md does not exist"
                 )
             else:
                 pytest.fail(
@@ -255,10 +271,6 @@ class TestCrossDomainTriggers:
 class TestHooksJsonScriptReferences:
     """Validate that hooks.json commands reference existing scripts."""
 
-    @pytest.fixture(scope="class")
-    def hooks_data(self):
-        return load_json(FORGE_DIR / "hooks" / "hooks.json")
-
     def test_all_hook_scripts_exist(self, hooks_data):
         """Every script referenced in hooks.json must exist on disk."""
         events = hooks_data.get("hooks", {})
@@ -266,10 +278,7 @@ class TestHooksJsonScriptReferences:
         for event_type, matchers in events.items():
             for matcher_block in matchers:
                 for hook in matcher_block.get("hooks", []):
-                    cmd = hook.get("command", "")
-                    # Extract script name from command like:
-                    # bash "${CLAUDE_PLUGIN_ROOT}/hooks/script_name.sh"
-                    match = re.search(r'hooks/([a-z_]+\.sh)', cmd)
+                    match = HOOK_SCRIPT_RE.search(hook.get("command", ""))
                     if match:
                         script_name = match.group(1)
                         script_path = FORGE_DIR / "hooks" / script_name
@@ -303,19 +312,13 @@ class TestHooksJsonScriptReferences:
 class TestPluginCommandReferences:
     """Validate command files exist in filesystem."""
 
-    def test_all_command_paths_exist(self):
+    def test_all_command_paths_exist(self, commands_tree):
         """Every expected command must exist as a flat .md file."""
-        expected_commands = {
-            "analyze", "implement", "improve", "document", "test", "build",
-            "brainstorm", "remember", "mock", "azure-pipeline", "etl-pipeline",
-            "azure-function",
-        }
-        commands_dir = FORGE_DIR / "commands"
-        missing = []
-        for cmd_name in expected_commands:
-            cmd_file = commands_dir / f"{cmd_name}.md"
-            if not cmd_file.exists():
-                missing.append(f"{cmd_name}: {cmd_name}.md not found")
+        missing = [
+            f"{cmd_name}: {cmd_name}.md not found"
+            for cmd_name in EXPECTED_COMMANDS_SORTED
+            if f"{cmd_name}.md" not in commands_tree["files"]
+        ]
         assert not missing, (
             f"Command validation failed: {missing}"
         )
@@ -26,18 +26,25 @@ from conftest import FORGE_DIR, extract_yaml_frontmatter
 # Constants
 # ---------------------------------------------------------------------------
 
-FRONTEND_UI_SKILLS = [
+FRONTEND_UI_SKILLS = (
     "accessibility",
     "animate",
     "nextjs",
     "react-forms",
     "responsive-images",
     "tailwind-patterns",
-]
+)
 
 SKILLS_DIR = FORGE_DIR / "skills"
 MEMORY_DIR = FORGE_DIR / "memory" / "skills"
 
+# Per-skill paths, built once at import
+_SKILL_DIR = {s: SKILLS_DIR / s for s in FRONTEND_UI_SKILLS}
+_SKILL_MD = {s: d / "SKILL.md" for s, d in _SKILL_DIR.items()}
+_EXAMPLES_MD = {s: d / "examples.md" for s, d in _SKILL_DIR.items()}
+_MEMORY_SKILL_DIR = {s: MEMORY_DIR / s for s in FRONTEND_UI_SKILLS}
+_MEMORY_INDEX = {s: d / "index.md" for s, d in _MEMORY_SKILL_DIR.items()}
+
 REQUIRED_FRONTMATTER_FIELDS = ["name", "version", "description", "context", "memory", "tags"]
 
 # Patterns that indicate hardcoded paths (should use interface references instead)
@@ -57,6 +64,32 @@ ALLOWED_PATH_REFS = [
     "../../interfaces/memory_store.md",
     "../../interfaces/schemas/",
 ]
+ALLOWED_PATH_RE = re.compile("|".join(re.escape(ref) for ref in ALLOWED_PATH_REFS))
+
+# Substrings the SKILL.md content tests look for
+SKILL_CONTENT_MARKERS = frozenset({
+    "MANDATORY WORKFLOW",
+    "Mandatory Workflow",
+    "Compliance Checklist",
+    "Version History",
+    "ContextProvider",
+    "contextProvider",
+    "MemoryStore",
+    "memoryStore",
+    "Load Memory",
+    "memoryStore.getSkillMemory",
+    "Load Context",
+    "Generate Output",
+    "/claudedocs/",
+    "Update Memory",
+    "memoryStore.update",
+    "shared_loading_patterns",
+    "Standard Memory Loading",
+})
+
+# examples.md scenario headers and fenced code blocks with a language tag,
+# fused so each file is scanned once
+EXAMPLES_SCAN_RE = re.compile(r"(?P<example>^## Example \d)|(?P<code>```\w+)", re.MULTILINE)
 
 
 # ---------------------------------------------------------------------------
@@ -64,20 +97,27 @@ ALLOWED_PATH_REFS = [
 # ---------------------------------------------------------------------------
 
 
-def _skill_dir(skill_name: str) -> Path:
-    return SKILLS_DIR / skill_name
-
-
-def _skill_md(skill_name: str) -> Path:
-    return SKILLS_DIR / skill_name / "SKILL.md"
+def _read_or_empty(path: Path) -> str:
+    """Read a file, returning "" if it is missing (existence is tested separately)."""
+    try:
+        return path.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return ""
 
 
-def _examples_md(skill_name: str) -> Path:
-    return SKILLS_DIR / skill_name / "examples.md"
+def _read_all(skill_name: str) -> tuple[str, str, str]:
+    """Return (SKILL.md, examples.md, memory index.md) contents for a skill."""
+    return (
+        _read_or_empty(_SKILL_MD[skill_name]),
+        _read_or_empty(_EXAMPLES_MD[skill_name]),
+        _read_or_empty(_MEMORY_INDEX[skill_name]),
+    )
 
 
-def _memory_index(skill_name: str) -> Path:
-    return MEMORY_DIR / skill_name / "index.md"
+@pytest.fixture(scope="session")
+def skill_texts() -> dict[str, tuple[str, str, str]]:
+    """Read every skill's files once for the content, examples and memory tests."""
+    return {s: _read_all(s) for s in FRONTEND_UI_SKILLS}
 
 
 # ---------------------------------------------------------------------------
@@ -91,28 +131,28 @@ class TestFrontendUISkillStructure:
     @pytest.mark.parametrize("skill", FRONTEND_UI_SKILLS)
     def test_skill_directory_exists(self, skill):
         """Each Frontend & UI skill must have a directory."""
-        assert _skill_dir(skill).is_dir(), (
+        assert _SKILL_DIR[skill].is_dir(), (
             f"Skill directory missing: skills/{skill}/"
         )
 
     @pytest.mark.parametrize("skill", FRONTEND_UI_SKILLS)
     def test_skill_md_exists(self, skill):
         """Each skill must have SKILL.md."""
-        assert _skill_md(skill).is_file(), (
+        assert _SKILL_MD[skill].is_file(), (
             f"Skill file missing: skills/{skill}/SKILL.md"
         )
 
     @pytest.mark.parametrize("skill", FRONTEND_UI_SKILLS)
     def test_examples_md_exists(self, skill):
         """Each skill must have examples.md."""
-        assert _examples_md(skill).is_file(), (
+        assert _EXAMPLES_MD[skill].is_file(), (
             f"Examples file missing: skills/{skill}/examples.md"
         )
 
     @pytest.mark.parametrize("skill", FRONTEND_UI_SKILLS)
     def test_memory_index_exists(self, skill):
         """Each skill must have a memory index file."""
-        assert _memory_index(skill).is_file(), (
+        assert _MEMORY_INDEX[skill].is_file(), (
             f"Memory index missing: memory/skills/{skill}/index.md"
         )
 
@@ -128,7 +168,7 @@ class TestFrontendUIFrontmatter:
     @pytest.mark.parametrize("skill", FRONTEND_UI_SKILLS)
     def test_has_frontmatter(self, skill):
         """SKILL.md must have YAML frontmatter."""
-        fm = extract_yaml_frontmatter(_skill_md(skill))
+        fm = extract_yaml_frontmatter(_SKILL_MD[skill])
         assert fm is not None, (
             f"skills/{skill}/SKILL.md: No YAML frontmatter found"
         )
@@ -136,7 +176,7 @@ class TestFrontendUIFrontmatter:
     @pytest.mark.parametrize("skill", FRONTEND_UI_SKILLS)
     def test_has_required_fields(self, skill):
         """Frontmatter must have all required fields."""
-        fm = extract_yaml_frontmatter(_skill_md(skill))
+        fm = extract_yaml_frontmatter(_SKILL_MD[skill])
         if fm is None:
             pytest.skip("No frontmatter")
         missing = [f for f in REQUIRED_FRONTMATTER_FIELDS if f not in fm]
@@ -147,7 +187,7 @@ class TestFrontendUIFrontmatter:
     @pytest.mark.parametrize("skill", FRONTEND_UI_SKILLS)
     def test_name_matches_directory(self, skill):
         """Frontmatter name must match directory name."""
-        fm = extract_yaml_frontmatter(_skill_md(skill))
+        fm = extract_yaml_frontmatter(_SKILL_MD[skill])
         if fm is None:
             pytest.skip("No frontmatter")
         assert fm.get("name") == skill, (
@@ -157,7 +197,7 @@ class TestFrontendUIFrontmatter:
     @pytest.mark.parametrize("skill", FRONTEND_UI_SKILLS)
     def test_version_is_1_0_0(self, skill):
         """Version must be 1.0.0 for initial release."""
-        fm = extract_yaml_frontmatter(_skill_md(skill))
+        fm = extract_yaml_frontmatter(_SKILL_MD[skill])
         if fm is None:
             pytest.skip("No frontmatter")
         assert fm.get("version") == "1.0.0", (
@@ -167,7 +207,7 @@ class TestFrontendUIFrontmatter:
     @pytest.mark.parametrize("skill", FRONTEND_UI_SKILLS)
     def test_description_not_empty(self, skill):
         """Description must not be empty."""
-        fm = extract_yaml_frontmatter(_skill_md(skill))
+        fm = extract_yaml_frontmatter(_SKILL_MD[skill])
         if fm is None:
             pytest.skip("No frontmatter")
         desc = fm.get("description", "")
@@ -178,7 +218,7 @@ class TestFrontendUIFrontmatter:
     @pytest.mark.parametrize("skill", FRONTEND_UI_SKILLS)
     def test_tags_present_and_populated(self, skill):
         """Tags must be a non-empty list."""
-        fm = extract_yaml_frontmatter(_skill_md(skill))
+        fm = extract_yaml_frontmatter(_SKILL_MD[skill])
         if fm is None:
             pytest.skip("No frontmatter")
         tags = fm.get("tags", [])
@@ -192,7 +232,7 @@ class TestFrontendUIFrontmatter:
     @pytest.mark.parametrize("skill", FRONTEND_UI_SKILLS)
     def test_context_has_primary_domain(self, skill):
         """Context must specify a primary_domain."""
-        fm = extract_yaml_frontmatter(_skill_md(skill))
+        fm = extract_yaml_frontmatter(_SKILL_MD[skill])
         if fm is None:
             pytest.skip("No frontmatter")
         context = fm.get("context", {})
@@ -203,7 +243,7 @@ class TestFrontendUIFrontmatter:
     @pytest.mark.parametrize("skill", FRONTEND_UI_SKILLS)
     def test_memory_has_scopes(self, skill):
         """Memory must define scopes."""
-        fm = extract_yaml_frontmatter(_skill_md(skill))
+        fm = extract_yaml_frontmatter(_SKILL_MD[skill])
         if fm is None:
             pytest.skip("No frontmatter")
         memory = fm.get("memory", {})
@@ -221,81 +261,91 @@ class TestFrontendUIFrontmatter:
 # ---------------------------------------------------------------------------
 
 
+@pytest.fixture(scope="session")
+def skill_markers(skill_texts) -> dict[str, frozenset[str]]:
+    """Map each skill to the SKILL_CONTENT_MARKERS present in its SKILL.md."""
+    markers = {}
+    for skill in FRONTEND_UI_SKILLS:
+        content = skill_texts[skill][0]
+        markers[skill] = frozenset(m for m in SKILL_CONTENT_MARKERS if m in content)
+    return markers
+
+
 class TestFrontendUISkillContent:
     """Validate SKILL.md content structure and conventions."""
 
     @pytest.mark.parametrize("skill", FRONTEND_UI_SKILLS)
-    def test_has_mandatory_workflow(self, skill):
+    def test_has_mandatory_workflow(self, skill, skill_markers):
         """SKILL.md must contain mandatory workflow section."""
-        content = _skill_md(skill).read_text(encoding="utf-8")
-        assert "MANDATORY WORKFLOW" in content or "Mandatory Workflow" in content, (
+        found = skill_markers[skill]
+        assert "MANDATORY WORKFLOW" in found or "Mandatory Workflow" in found, (
             f"skills/{skill}/SKILL.md: Missing mandatory workflow section"
         )
 
     @pytest.mark.parametrize("skill", FRONTEND_UI_SKILLS)
-    def test_has_compliance_checklist(self, skill):
+    def test_has_compliance_checklist(self, skill, skill_markers):
         """SKILL.md must contain a compliance checklist."""
-        content = _skill_md(skill).read_text(encoding="utf-8")
-        assert "Compliance Checklist" in content, (
+        found = skill_markers[skill]
+        assert "Compliance Checklist" in found, (
             f"skills/{skill}/SKILL.md: Missing compliance checklist"
         )
 
     @pytest.mark.parametrize("skill", FRONTEND_UI_SKILLS)
-    def test_has_version_history(self, skill):
+    def test_has_version_history(self, skill, skill_markers):
         """SKILL.md must contain version history."""
-        content = _skill_md(skill).read_text(encoding="utf-8")
-        assert "Version History" in content, (
+        found = skill_markers[skill]
+        assert "Version History" in found, (
             f"skills/{skill}/SKILL.md: Missing version history section"
         )
 
     @pytest.mark.parametrize("skill", FRONTEND_UI_SKILLS)
-    def test_has_interface_references(self, skill):
+    def test_has_interface_references(self, skill, skill_markers):
         """SKILL.md must reference ContextProvider and MemoryStore interfaces."""
-        content = _skill_md(skill).read_text(encoding="utf-8")
-        assert "ContextProvider" in content or "contextProvider" in content, (
+        found = skill_markers[skill]
+        assert "ContextProvider" in found or "contextProvider" in found, (
             f"skills/{skill}/SKILL.md: Missing ContextProvider reference"
         )
-        assert "MemoryStore" in content or "memoryStore" in content, (
+        assert "MemoryStore" in found or "memoryStore" in found, (
             f"skills/{skill}/SKILL.md: Missing MemoryStore reference"
         )
 
     @pytest.mark.parametrize("skill", FRONTEND_UI_SKILLS)
-    def test_has_memory_loading_step(self, skill):
+    def test_has_memory_loading_step(self, skill, skill_markers):
         """SKILL.md must include a memory loading step."""
-        content = _skill_md(skill).read_text(encoding="utf-8")
-        assert "Load Memory" in content or "memoryStore.getSkillMemory" in content, (
+        found = skill_markers[skill]
+        assert "Load Memory" in found or "memoryStore.getSkillMemory" in found, (
             f"skills/{skill}/SKILL.md: Missing memory loading step"
         )
 
     @pytest.mark.parametrize("skill", FRONTEND_UI_SKILLS)
-    def test_has_context_loading_step(self, skill):
+    def test_has_context_loading_step(self, skill, skill_markers):
         """SKILL.md must include a context loading step."""
-        content = _skill_md(skill).read_text(encoding="utf-8")
-        assert "Load Context" in content or "contextProvider" in content, (
+        found = skill_markers[skill]
+        assert "Load Context" in found or "contextProvider" in found, (
             f"skills/{skill}/SKILL.md: Missing context loading step"
         )
 
     @pytest.mark.parametrize("skill", FRONTEND_UI_SKILLS)
-    def test_has_output_step(self, skill):
+    def test_has_output_step(self, skill, skill_markers):
         """SKILL.md must include an output generation step."""
-        content = _skill_md(skill).read_text(encoding="utf-8")
-        assert "Generate Output" in content or "/claudedocs/" in content, (
+        found = skill_markers[skill]
+        assert "Generate Output" in found or "/claudedocs/" in found, (
             f"skills/{skill}/SKILL.md: Missing output generation step"
         )
 
     @pytest.mark.parametrize("skill", FRONTEND_UI_SKILLS)
-    def test_has_memory_update_step(self, skill):
+    def test_has_memory_update_step(self, skill, skill_markers):
         """SKILL.md must include a memory update step."""
-        content = _skill_md(skill).read_text(encoding="utf-8")
-        assert "Update Memory" in content or "memoryStore.update" in content, (
+        found = skill_markers[skill]
+        assert "Update Memory" in found or "memoryStore.update" in found, (
             f"skills/{skill}/SKILL.md: Missing memory update step"
         )
 
     @pytest.mark.parametrize("skill", FRONTEND_UI_SKILLS)
-    def test_references_shared_loading_patterns(self, skill):
+    def test_references_shared_loading_patterns(self, skill, skill_markers):
         """SKILL.md must reference shared loading patterns."""
-        content = _skill_md(skill).read_text(encoding="utf-8")
-        assert "shared_loading_patterns" in content or "Standard Memory Loading" in content, (
+        found = skill_markers[skill]
+        assert "shared_loading_patterns" in found or "Standard Memory Loading" in found, (
             f"skills/{skill}/SKILL.md: Missing shared loading patterns reference"
         )
 
@@ -305,34 +355,48 @@ class TestFrontendUISkillContent:
 # ---------------------------------------------------------------------------
 
 
+@pytest.fixture(scope="session")
+def examples_stats(skill_texts) -> dict[str, tuple[int, int, int]]:
+    """Map each skill to (example_count, code_block_count, length) of examples.md."""
+    stats = {}
+    for skill in FRONTEND_UI_SKILLS:
+        content = skill_texts[skill][1]
+        example_count = code_blocks = 0
+        for match in EXAMPLES_SCAN_RE.finditer(content):
+            if match.lastgroup == "example":
+                example_count += 1
+            else:
+                code_blocks += 1
+        stats[skill] = (example_count, code_blocks, len(content))
+    return stats
+
+
 class TestFrontendUIExamples:
     """Validate examples.md content."""
 
     @pytest.mark.parametrize("skill", FRONTEND_UI_SKILLS)
-    def test_has_at_least_3_examples(self, skill):
+    def test_has_at_least_3_examples(self, skill, examples_stats):
         """examples.md must contain at least 3 usage scenarios."""
-        content = _examples_md(skill).read_text(encoding="utf-8")
-        # Count ## Example or ## Scenario headers
-        example_count = len(re.findall(r"^## Example \d", content, re.MULTILINE))
+        # Count ## Example headers
+        example_count = examples_stats[skill][0]
         assert example_count >= 3, (
             f"skills/{skill}/examples.md: Found {example_count} examples, need at least 3"
         )
 
     @pytest.mark.parametrize("skill", FRONTEND_UI_SKILLS)
-    def test_examples_have_code_blocks(self, skill):
+    def test_examples_have_code_blocks(self, skill, examples_stats):
         """examples.md must contain code examples."""
-        content = _examples_md(skill).read_text(encoding="utf-8")
-        code_blocks = len(re.findall(r"```\w+", content))
+        code_blocks = examples_stats[skill][1]
         assert code_blocks >= 3, (
             f"skills/{skill}/examples.md: Found {code_blocks} code blocks, need at least 3"
         )
 
     @pytest.mark.parametrize("skill", FRONTEND_UI_SKILLS)
-    def test_examples_not_empty(self, skill):
+    def test_examples_not_empty(self, skill, examples_stats):
         """examples.md must have substantial content."""
-        content = _examples_md(skill).read_text(encoding="utf-8")
-        assert len(content) > 500, (
-            f"skills/{skill}/examples.md: Content too short ({len(content)} chars)"
+        length = examples_stats[skill][2]
+        assert length > 500, (
+            f"skills/{skill}/examples.md: Content too short ({length} chars)"
         )
 
 
@@ -347,30 +411,30 @@ class TestFrontendUIMemory:
     @pytest.mark.parametrize("skill", FRONTEND_UI_SKILLS)
     def test_memory_dir_exists(self, skill):
         """Memory directory must exist for each skill."""
-        assert (MEMORY_DIR / skill).is_dir(), (
+        assert _MEMORY_SKILL_DIR[skill].is_dir(), (
             f"Memory directory missing: memory/skills/{skill}/"
         )
 
     @pytest.mark.parametrize("skill", FRONTEND_UI_SKILLS)
-    def test_memory_index_references_skill(self, skill):
+    def test_memory_index_references_skill(self, skill, skill_texts):
         """Memory index must reference the parent skill."""
-        content = _memory_index(skill).read_text(encoding="utf-8")
+        content = skill_texts[skill][2]
         assert skill in content, (
             f"memory/skills/{skill}/index.md: Does not reference skill name '{skill}'"
         )
 
     @pytest.mark.parametrize("skill", FRONTEND_UI_SKILLS)
-    def test_memory_index_has_purpose(self, skill):
+    def test_memory_index_has_purpose(self, skill, skill_texts):
         """Memory index must have a Purpose section."""
-        content = _memory_index(skill).read_text(encoding="utf-8")
+        content = skill_texts[skill][2]
         assert "## Purpose" in content, (
             f"memory/skills/{skill}/index.md: Missing Purpose section"
         )
 
     @pytest.mark.parametrize("skill", FRONTEND_UI_SKILLS)
-    def test_memory_index_has_file_descriptions(self, skill):
+    def test_memory_index_has_file_descriptions(self, skill, skill_texts):
         """Memory index must describe memory files."""
-        content = _memory_index(skill).read_text(encoding="utf-8")
+        content = skill_texts[skill][2]
         assert "project_overview" in content or "project_overview.md" in content, (
             f"memory/skills/{skill}/index.md: Missing project_overview file description"
         )
@@ -388,16 +452,16 @@ class TestNoHardcodedPaths:
     """Ensure SKILL.md files use interface references, not hardcoded paths."""
 
     @pytest.mark.parametrize("skill", FRONTEND_UI_SKILLS)
-    def test_no_hardcoded_context_paths(self, skill):
+    def test_no_hardcoded_context_paths(self, skill, skill_texts):
         """SKILL.md must not contain hardcoded context file paths."""
-        content = _skill_md(skill).read_text(encoding="utf-8")
+        content = skill_texts[skill][0]
+        # Every pattern needs one of these literals; skip the regexes if absent
+        if "forge-plugin/" not in content and "../../" not in content:
+            return
         for pattern in HARDCODED_PATH_PATTERNS:
             matches = pattern.findall(content)
             # Filter out allowed references (interface docs)
-            real_violations = [
-                m for m in matches
-                if not any(allowed in m for allowed in ALLOWED_PATH_REFS)
-            ]
+            real_violations = [m for m in matches if not ALLOWED_PATH_RE.search(m)]
             assert not real_violations, (
                 f"skills/{skill}/SKILL.md: Hardcoded path found: {real_violations}. "
                 f"Use interface references instead."
@@ -9,14 +9,16 @@ Validates:
 Phase 2 of the Forge Testing Architecture.
 """
 
-import re
+import os
 import sys
+from collections import Counter
+from collections.abc import Iterator
 from pathlib import Path
 
 import pytest
 
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
-from conftest import FORGE_DIR, load_json
+from conftest import FORGE_DIR, HOOK_SCRIPT_RE
 
 
 # ---------------------------------------------------------------------------
@@ -42,39 +44,30 @@ VALID_EVENT_TYPES = {
 
 def _get_hook_scripts_on_disk() -> set[str]:
     """Return set of .sh filenames directly in hooks/ (not lib/)."""
-    return {
-        f.name
-        for f in HOOKS_DIR.iterdir()
-        if f.is_file() and f.suffix == ".sh"
-    }
+    # DirEntry.is_file() reuses the type from the listing; no stat per entry
+    with os.scandir(HOOKS_DIR) as it:
+        return {e.name for e in it if e.name.endswith(".sh") and e.is_file()}
 
 
-def _get_registered_scripts(hooks_data: dict) -> set[str]:
-    """Extract all script names referenced in hooks.json."""
-    scripts = set()
-    events = hooks_data.get("hooks", {})
-    for matchers in events.values():
+def _walk_registrations(hooks_data: dict) -> Iterator[tuple[str, str, str]]:
+    """Yield (event_type, matcher, script_name) for every hook command in hooks.json."""
+    for event_type, matchers in hooks_data.get("hooks", {}).items():
         for matcher_block in matchers:
-            for hook in matcher_block.get("hooks", []):
-                cmd = hook.get("command", "")
-                match = re.search(r'hooks/([a-z_]+\.sh)', cmd)
+            matcher = matcher_block.get("matcher", "")
+            for hook in matcher_block.get("hooks", ()):
+                match = HOOK_SCRIPT_RE.search(hook.get("command", ""))
                 if match:
-                    scripts.add(match.group(1))
-    return scripts
+                    yield event_type, matcher, match.group(1)
 
 
-def _get_registrations(hooks_data: dict) -> list[tuple[str, str]]:
-    """Return list of (event_type, script_name) tuples for all registrations."""
-    registrations = []
-    events = hooks_data.get("hooks", {})
-    for event_type, matchers in events.items():
-        for matcher_block in matchers:
-            for hook in matcher_block.get("hooks", []):
-                cmd = hook.get("command", "")
-                match = re.search(r'hooks/([a-z_]+\.sh)', cmd)
-                if match:
-                    registrations.append((event_type, match.group(1)))
-    return registrations
+def _get_registered_scripts(hooks_data: dict) -> set[str]:
+    """Extract all script names referenced in hooks.json."""
+    return {script for _, _, script in _walk_registrations(hooks_data)}
+
+
+def _get_registrations(hooks_data: dict) -> list[tuple[str, str, str]]:
+    """Return list of (event_type, matcher, script_name) tuples for all registrations."""
+    return list(_walk_registrations(hooks_data))
 
 
 # ---------------------------------------------------------------------------
@@ -85,12 +78,6 @@ def _get_registrations(hooks_data: dict) -> list[tuple[str, str]]:
 class TestHookRegistration:
     """Validate hook registration completeness."""
 
-    @pytest.fixture(scope="class")
-    def hooks_data(self):
-        hooks_path = HOOKS_DIR / "hooks.json"
-        assert hooks_path.exists(), "hooks.json not found"
-        return load_json(hooks_path)
-
     def test_hooks_json_exists(self):
         """hooks.json must exist."""
         assert (HOOKS_DIR / "hooks.json").exists()
@@ -138,21 +125,15 @@ class TestHookRegistration:
 
     def test_no_duplicate_registrations(self, hooks_data):
         """No script should be registered twice for the same event+matcher combo."""
-        events = hooks_data.get("hooks", {})
-        for event_type, matchers in events.items():
-            for i, matcher_block in enumerate(matchers):
-                matcher = matcher_block.get("matcher", "")
-                scripts_in_block = []
-                for hook in matcher_block.get("hooks", []):
-                    cmd = hook.get("command", "")
-                    match = re.search(r'hooks/([a-z_]+\.sh)', cmd)
-                    if match:
-                        script_name = match.group(1)
-                        assert script_name not in scripts_in_block, (
-                            f"hooks.json: '{script_name}' registered twice "
-                            f"in {event_type}[matcher='{matcher}']"
-                        )
-                        scripts_in_block.append(script_name)
+        counts = Counter(_get_registrations(hooks_data))
+        duplicates = [
+            f"'{script}' in {event_type}[matcher='{matcher}']"
+            for (event_type, matcher, script), n in counts.items()
+            if n > 1
+        ]
+        assert not duplicates, (
+            f"hooks.json: scripts registered more than once: {duplicates}"
+        )
 
     def test_hook_count_is_expected(self, hooks_data):
         """hooks.json should register at least 20 unique hook scripts."""
@@ -10,16 +10,18 @@ Validates:
 Phase 1 of the Forge Testing Architecture.
 """
 
+import functools
 import json
-import re
+import os
 import sys
+from collections.abc import Callable
 from pathlib import Path
 
 import pytest
 
 # Allow running standalone: python3 tests/layer1/test_json_schemas.py
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
-from conftest import FORGE_DIR, load_json
+from conftest import FORGE_DIR, HOOK_SCRIPT_RE, SEMVER_PATTERN, load_json
 
 
 # ---------------------------------------------------------------------------
@@ -50,26 +52,70 @@ VALID_DOMAINS = {
     "security",
 }
 
-SEMVER_PATTERN = re.compile(r"^\d+\.\d+\.\d+(-[a-zA-Z0-9]+(\.[a-zA-Z0-9]+)*)?$")
-
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
 
-def _load_schema(name: str) -> dict:
-    """Load a JSON schema from the interfaces/schemas directory."""
-    schema_path = FORGE_DIR / "interfaces" / "schemas" / name
-    assert schema_path.exists(), f"Schema not found: {schema_path}"
-    return load_json(schema_path)
+def _compile_validator(schema: dict) -> Callable[[dict], list[str]]:
+    """Compile a schema into a function returning every violation message.
+
+    fastjsonschema's generated validator, when installed, answers the common
+    passing case. It stops at the first error, so a failing instance is
+    re-checked with jsonschema's iter_errors to report all violations at once.
+    """
+    from jsonschema.validators import validator_for
+
+    validator_cls = validator_for(schema)
+    validator_cls.check_schema(schema)
+    validator = validator_cls(schema)
+
+    def collect(instance: dict) -> list[str]:
+        return [f"{e.json_path}: {e.message}" for e in validator.iter_errors(instance)]
+
+    try:
+        import fastjsonschema
+    except ImportError:
+        return collect
+
+    try:
+        # use_default=False: instances are shared cached data, never fill defaults in
+        compiled = fastjsonschema.compile(schema, use_default=False)
+    except fastjsonschema.JsonSchemaDefinitionException:
+        return collect
+
+    def check(instance: dict) -> list[str]:
+        try:
+            compiled(instance)
+        except fastjsonschema.JsonSchemaValueException as e:
+            return collect(instance) or [e.message]
+        return []
+
+    return check
 
 
-def _get_agent_configs() -> list[tuple[str, Path]]:
-    """Return list of (agent_name, config_path) tuples."""
+@functools.lru_cache(maxsize=1)
+def _get_agent_configs() -> tuple[tuple[str, Path], ...]:
+    """Return (agent_name, config_path) tuples, scanning agents/ once."""
     agents_dir = FORGE_DIR / "agents"
-    configs = sorted(agents_dir.glob("*.config.json"))
-    return [(p.name.replace(".config.json", ""), p) for p in configs]
+    with os.scandir(agents_dir) as it:
+        names = sorted(e.name for e in it if e.name.endswith(".config.json"))
+    return tuple((n.replace(".config.json", ""), agents_dir / n) for n in names)
+
+
+# One param per agent; the xdist_group mark keeps all checks for an agent on
+# the same worker under ``pytest -n auto --dist loadgroup``.
+_AGENT_PARAMS = [
+    pytest.param(name, path, id=name, marks=pytest.mark.xdist_group(name))
+    for name, path in _get_agent_configs()
+]
+
+
+@pytest.fixture(scope="session")
+def schema_validator(agent_config_schema) -> Callable[[dict], list[str]]:
+    """Compiled checker for agent_config.schema.json, built once per session."""
+    return _compile_validator(agent_config_schema)
 
 
 # ---------------------------------------------------------------------------
@@ -80,10 +126,6 @@ def _get_agent_configs() -> list[tuple[str, Path]]:
 class TestAgentConfigSchemas:
     """Validate all agent config.json files against the JSON schema."""
 
-    @pytest.fixture(scope="class")
-    def schema(self):
-        return _load_schema("agent_config.schema.json")
-
     @pytest.fixture(scope="class")
     def agent_configs(self):
         return _get_agent_configs()
@@ -92,11 +134,7 @@ class TestAgentConfigSchemas:
         """At least one agent config must exist."""
         assert len(agent_configs) > 0, "No agent config files found"
 
-    @pytest.mark.parametrize(
-        "agent_name,config_path",
-        _get_agent_configs(),
-        ids=[name for name, _ in _get_agent_configs()],
-    )
+    @pytest.mark.parametrize("agent_name,config_path", _AGENT_PARAMS)
     def test_agent_config_valid_json(self, agent_name, config_path):
         """Each agent config must be valid JSON."""
         try:
@@ -104,28 +142,20 @@ class TestAgentConfigSchemas:
         except json.JSONDecodeError as e:
             pytest.fail(f"{config_path.name}: Invalid JSON — {e}")
 
-    @pytest.mark.parametrize(
-        "agent_name,config_path",
-        _get_agent_configs(),
-        ids=[name for name, _ in _get_agent_configs()],
-    )
-    def test_agent_config_schema_compliance(self, agent_name, config_path, schema):
+    @pytest.mark.parametrize("agent_name,config_path", _AGENT_PARAMS)
+    def test_agent_config_schema_compliance(
+        self, agent_name, config_path, schema_validator
+    ):
         """Each agent config must validate against agent_config.schema.json."""
-        from jsonschema import validate, ValidationError
-
-        config = load_json(config_path)
         # Strip $schema meta-property — it's not a data field
-        config_for_validation = {k: v for k, v in config.items() if k != "$schema"}
-        try:
-            validate(instance=config_for_validation, schema=schema)
-        except ValidationError as e:
-            pytest.fail(f"{config_path.name}: Schema violation — {e.message}")
-
-    @pytest.mark.parametrize(
-        "agent_name,config_path",
-        _get_agent_configs(),
-        ids=[name for name, _ in _get_agent_configs()],
-    )
+        config = load_json(config_path)
+        errors = schema_validator({k: v for k, v in config.items() if k != "$schema"})
+        assert not errors, (
+            f"{config_path.name}: {len(errors)} schema violation(s):\n  "
+            + "\n  ".join(errors)
+        )
+
+    @pytest.mark.parametrize("agent_name,config_path", _AGENT_PARAMS)
     def test_agent_config_name_matches_filename(self, agent_name, config_path):
         """Agent config 'name' field must match the filename prefix."""
         config = load_json(config_path)
@@ -134,11 +164,7 @@ class TestAgentConfigSchemas:
             f"but filename implies '{agent_name}'"
         )
 
-    @pytest.mark.parametrize(
-        "agent_name,config_path",
-        _get_agent_configs(),
-        ids=[name for name, _ in _get_agent_configs()],
-    )
+    @pytest.mark.parametrize("agent_name,config_path", _AGENT_PARAMS)
     def test_agent_config_version_semver(self, agent_name, config_path):
         """Agent config 'version' must match semver pattern."""
         config = load_json(config_path)
@@ -147,11 +173,7 @@ class TestAgentConfigSchemas:
             f"{config_path.name}: version '{version}' is not valid semver"
         )
 
-    @pytest.mark.parametrize(
-        "agent_name,config_path",
-        _get_agent_configs(),
-        ids=[name for name, _ in _get_agent_configs()],
-    )
+    @pytest.mark.parametrize("agent_name,config_path", _AGENT_PARAMS)
     def test_agent_config_primary_domains_valid(self, agent_name, config_path):
         """Agent config primaryDomains must use valid domain enum values."""
         config = load_json(config_path)
@@ -161,11 +183,7 @@ class TestAgentConfigSchemas:
                 f"{config_path.name}: primaryDomain '{domain}' not in valid domains"
             )
 
-    @pytest.mark.parametrize(
-        "agent_name,config_path",
-        _get_agent_configs(),
-        ids=[name for name, _ in _get_agent_configs()],
-    )
+    @pytest.mark.parametrize("agent_name,config_path", _AGENT_PARAMS)
     def test_agent_config_has_paired_markdown(self, agent_name, config_path):
         """Each agent config must have a paired .md file."""
         md_path = config_path.parent / f"{agent_name}.md"
@@ -182,12 +200,6 @@ class TestAgentConfigSchemas:
 class TestHooksJson:
     """Validate hooks.json structure and event types."""
 
-    @pytest.fixture(scope="class")
-    def hooks_data(self):
-        hooks_path = FORGE_DIR / "hooks" / "hooks.json"
-        assert hooks_path.exists(), "hooks.json not found"
-        return load_json(hooks_path)
-
     def test_hooks_json_has_hooks_key(self, hooks_data):
         """hooks.json must have a top-level 'hooks' key."""
         assert "hooks" in hooks_data, "hooks.json missing 'hooks' key"
@@ -231,20 +243,26 @@ class TestHooksJson:
 
     def test_hooks_reference_existing_scripts(self, hooks_data):
         """Hook commands must reference scripts that exist on disk."""
+        refs = []
         events = hooks_data.get("hooks", {})
         for event_type, matchers in events.items():
             for matcher_block in matchers:
                 for hook in matcher_block.get("hooks", []):
                     cmd = hook.get("command", "")
                     # Extract script path from: bash "${CLAUDE_PLUGIN_ROOT}/hooks/script.sh"
-                    match = re.search(r'hooks/([a-z_]+\.sh)', cmd)
+                    match = HOOK_SCRIPT_RE.search(cmd)
                     if match:
-                        script_name = match.group(1)
-                        script_path = FORGE_DIR / "hooks" / script_name
-                        assert script_path.exists(), (
-                            f"hooks.json: '{event_type}' references "
-                            f"non-existent script '{script_name}'"
-                        )
+                        refs.append((event_type, match.group(1)))
+
+        # One directory scan instead of a stat() per reference
+        existing_scripts = {p.name for p in (FORGE_DIR / "hooks").glob("*.sh")}
+
+        missing = [
+            f"'{event_type}' references non-existent script '{script_name}'"
+            for event_type, script_name in refs
+            if script_name not in existing_scripts
+        ]
+        assert not missing, f"hooks.json: {missing}"
 
 
 # ---------------------------------------------------------------------------
@@ -255,12 +273,6 @@ class TestHooksJson:
 class TestPluginJson:
     """Validate plugin.json structure (commands are discovered from filesystem)."""
 
-    @pytest.fixture(scope="class")
-    def plugin_data(self):
-        plugin_path = FORGE_DIR / ".claude-plugin" / "plugin.json"
-        assert plugin_path.exists(), "plugin.json not found at .claude-plugin/plugin.json"
-        return load_json(plugin_path)
-
     def test_plugin_has_name(self, plugin_data):
         """plugin.json must have a 'name' field."""
         assert "name" in plugin_data, "plugin.json missing 'name'"
@@ -288,12 +300,6 @@ class TestPluginJson:
 class TestRootSafetyProfile:
     """Validate root_safety_profile.json structure."""
 
-    @pytest.fixture(scope="class")
-    def safety_data(self):
-        safety_path = FORGE_DIR / "templates" / "root_safety_profile.json"
-        assert safety_path.exists(), "root_safety_profile.json not found"
-        return load_json(safety_path)
-
     def test_safety_has_version(self, safety_data):
         """Safety profile must have a version."""
         assert "version" in safety_data
@@ -347,12 +353,6 @@ class TestRootSafetyProfile:
 class TestFrameworkConflicts:
     """Validate framework_conflicts.json structure."""
 
-    @pytest.fixture(scope="class")
-    def conflicts_data(self):
-        conflicts_path = FORGE_DIR / "hooks" / "lib" / "framework_conflicts.json"
-        assert conflicts_path.exists(), "framework_conflicts.json not found"
-        return load_json(conflicts_path)
-
     def test_conflicts_is_valid_json(self, conflicts_data):
         """framework_conflicts.json must be valid JSON (loaded successfully)."""
         assert isinstance(conflicts_data, dict)
@@ -11,6 +11,8 @@ Validates:
 Phase 2 of the Forge Testing Architecture.
 """
 
+import functools
+import os
 import re
 import sys
 from pathlib import Path
@@ -53,36 +55,51 @@ TIMESTAMP_PATTERNS = [
 # ---------------------------------------------------------------------------
 
 
-def _get_memory_content_files() -> list[tuple[str, Path]]:
+@functools.lru_cache(maxsize=1)
+def _get_memory_content_files() -> tuple[tuple[str, Path], ...]:
     """Return (relative_path, full_path) for actual memory content .md files.
 
     Excludes operational files (index.md, lifecycle.md, etc.) and .gitkeep.
+    The memory tree is walked once per session.
     """
-    files = []
-    for f in sorted(MEMORY_DIR.rglob("*.md")):
-        if f.name in OPERATIONAL_FILES:
-            continue
-        files.append((str(f.relative_to(MEMORY_DIR)), f))
-    return files
+    return tuple(
+        (str(f.relative_to(MEMORY_DIR)), f)
+        for f in sorted(MEMORY_DIR.rglob("*.md"))
+        if f.name not in OPERATIONAL_FILES
+    )
+
+
+_MEMORY_FILE_IDS = [r for r, _ in _get_memory_content_files()]
 
 
 def _get_agent_names() -> set[str]:
     """Return set of actual agent names from agents/ directory."""
-    agents_dir = FORGE_DIR / "agents"
-    return {
-        p.name.replace(".config.json", "")
-        for p in agents_dir.glob("*.config.json")
-    }
+    with os.scandir(FORGE_DIR / "agents") as it:
+        return {
+            e.name.replace(".config.json", "")
+            for e in it
+            if e.name.endswith(".config.json")
+        }
 
 
 def _get_skill_names() -> set[str]:
     """Return set of actual skill names from skills/ directory."""
-    skills_dir = FORGE_DIR / "skills"
-    return {
-        d.name
-        for d in skills_dir.iterdir()
-        if d.is_dir() and not d.name.startswith(".")
-    }
+    with os.scandir(FORGE_DIR / "skills") as it:
+        return {
+            e.name
+            for e in it
+            if e.is_dir() and not e.name.startswith(".")
+        }
+
+
+@functools.lru_cache(maxsize=None)
+def _memory_file_stats(filepath: Path) -> tuple[str, int]:
+    """Return (first 10 lines, line count) for a memory file, read once."""
+    with open(filepath, "rb") as f:
+        data = f.read()
+    line_count = data.count(b"\n") + (0 if not data or data.endswith(b"\n") else 1)
+    head = b"\n".join(data.split(b"\n", 10)[:10])
+    return head.decode("utf-8"), line_count
 
 
 def _file_type_from_name(filename: str) -> str:
@@ -151,12 +168,15 @@ class TestAgentMemoryDirs:
         agents_memory_dir = MEMORY_DIR / "agents"
         if not agents_memory_dir.is_dir():
             pytest.skip("memory/agents/ not found")
-        for agent_dir in sorted(agents_memory_dir.iterdir()):
-            if agent_dir.is_dir() and not agent_dir.name.startswith("."):
-                readme = agent_dir / "README.md"
-                assert readme.exists(), (
-                    f"memory/agents/{agent_dir.name}/: Missing README.md"
-                )
+        with os.scandir(agents_memory_dir) as it:
+            agent_dirs = sorted(
+                e.name for e in it if e.is_dir() and not e.name.startswith(".")
+            )
+        for name in agent_dirs:
+            readme = agents_memory_dir / name / "README.md"
+            assert readme.exists(), (
+                f"memory/agents/{name}/: Missing README.md"
+            )
 
 
 # ---------------------------------------------------------------------------
@@ -175,12 +195,15 @@ class TestSkillMemoryDirs:
         """Skill memory dirs should correspond to actual skills."""
         skills_memory_dir = MEMORY_DIR / "skills"
         actual_skills = _get_skill_names()
-        for skill_dir in sorted(skills_memory_dir.iterdir()):
-            if skill_dir.is_dir() and not skill_dir.name.startswith("."):
-                assert skill_dir.name in actual_skills, (
-                    f"memory/skills/{skill_dir.name}/: No matching skill directory. "
-                    f"Orphaned memory directory?"
-                )
+        with os.scandir(skills_memory_dir) as it:
+            memory_skills = sorted(
+                e.name for e in it if e.is_dir() and not e.name.startswith(".")
+            )
+        for name in memory_skills:
+            assert name in actual_skills, (
+                f"memory/skills/{name}/: No matching skill directory. "
+                f"Orphaned memory directory?"
+            )
 
 
 # ---------------------------------------------------------------------------
@@ -194,14 +217,14 @@ class TestMemoryFileTimestamps:
     @pytest.mark.parametrize(
         "rel_path,filepath",
         _get_memory_content_files(),
-        ids=[r for r, _ in _get_memory_content_files()],
+        ids=_MEMORY_FILE_IDS,
     )
     def test_memory_file_has_timestamp(self, rel_path, filepath):
         """Memory content files should have a Last Updated timestamp."""
-        content = filepath.read_text(encoding="utf-8")
         # Check first 10 lines for timestamp
-        first_lines = "\n".join(content.split("\n")[:10])
-        has_timestamp = any(
+        first_lines, _ = _memory_file_stats(filepath)
+        # Both accepted formats contain the literal "Last Updated"
+        has_timestamp = "Last Updated" in first_lines and any(
             pattern.search(first_lines)
             for pattern in TIMESTAMP_PATTERNS
         )
@@ -225,14 +248,14 @@ class TestMemoryFileLineLimits:
     @pytest.mark.parametrize(
         "rel_path,filepath",
         _get_memory_content_files(),
-        ids=[r for r, _ in _get_memory_content_files()],
+        ids=_MEMORY_FILE_IDS,
     )
     def test_memory_file_within_line_limits(self, rel_path, filepath):
         """Memory files must not exceed their type-specific line limit."""
         file_type = _file_type_from_name(filepath.name)
         limit = LINE_LIMITS.get(file_type, LINE_LIMITS["_default"])
 
-        line_count = len(filepath.read_text(encoding="utf-8").splitlines())
+        _, line_count = _memory_file_stats(filepath)
         assert line_count <= limit, (
             f"{rel_path}: {line_count} lines exceeds {file_type} limit of {limit}"
         )
@@ -12,14 +12,24 @@ Validates:
 Phase 2 of the Forge Testing Architecture.
 """
 
-import re
+import os
 import sys
 from pathlib import Path
+from pprint import pformat
 
 import pytest
 
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
-from conftest import FORGE_DIR, load_json
+from conftest import (
+    EXPECTED_COMMANDS,
+    EXPECTED_COMMANDS_SORTED,
+    FORGE_DIR,
+    SEMVER_PATTERN,
+)
+
+# Keep the filesystem-bound layer-1 modules on one xdist worker so the
+# session-scoped commands_tree snapshot is built once and stays warm.
+pytestmark = pytest.mark.xdist_group("layer1_fs")
 
 
 # ---------------------------------------------------------------------------
@@ -28,13 +38,18 @@ from conftest import FORGE_DIR, load_json
 
 PLUGIN_DIR = FORGE_DIR / ".claude-plugin"
 PLUGIN_JSON = PLUGIN_DIR / "plugin.json"
-SEMVER_PATTERN = re.compile(r"^\d+\.\d+\.\d+(-[a-zA-Z0-9]+(\.[a-zA-Z0-9]+)*)?$")
 
-EXPECTED_COMMANDS = {
-    "analyze", "implement", "improve", "document", "test", "build",
-    "brainstorm", "remember", "mock", "azure-pipeline", "etl-pipeline",
-    "azure-function",
-}
+COMMANDS_DIR = FORGE_DIR / "commands"
+
+
+def _frontmatter_problem(path: Path) -> str | None:
+    """Return what is wrong with a file's frontmatter delimiters, or None."""
+    data = path.read_bytes()
+    if not data.startswith(b"---"):
+        return "missing YAML frontmatter"
+    if data.find(b"\n---", 3) == -1:
+        return "incomplete YAML frontmatter"
+    return None
 
 
 # ---------------------------------------------------------------------------
@@ -47,22 +62,22 @@ class TestPluginManifestStructure:
 
     def test_claude_plugin_dir_exists(self):
         """.claude-plugin/ directory must exist."""
-        assert PLUGIN_DIR.is_dir(), ".claude-plugin/ directory not found"
+        assert os.path.isdir(PLUGIN_DIR), ".claude-plugin/ directory not found"
 
     def test_plugin_json_exists(self):
         """plugin.json must exist inside .claude-plugin/."""
-        assert PLUGIN_JSON.is_file(), ".claude-plugin/plugin.json not found"
+        assert os.path.isfile(PLUGIN_JSON), ".claude-plugin/plugin.json not found"
 
-    def test_plugin_json_is_valid_json(self):
+    def test_plugin_json_is_valid_json(self, plugin_data):
         """plugin.json must be valid JSON."""
-        try:
-            load_json(PLUGIN_JSON)
-        except Exception as e:
-            pytest.fail(f"plugin.json is not valid JSON: {e}")
+        # conftest's session fixture parses plugin.json once for every module;
+        # a decode error surfaces there, so this is only a type check
+        assert isinstance(plugin_data, dict), "plugin.json must contain a JSON object"
 
     def test_claude_plugin_dir_contents(self):
         """.claude-plugin/ should only contain plugin.json."""
-        contents = [f.name for f in PLUGIN_DIR.iterdir() if not f.name.startswith(".")]
+        with os.scandir(PLUGIN_DIR) as it:
+            contents = [e.name for e in it if not e.name.startswith(".")]
         assert "plugin.json" in contents, "plugin.json not in .claude-plugin/"
         # Allow plugin.json and potentially other config files
         for item in contents:
@@ -79,42 +94,38 @@ class TestPluginManifestStructure:
 class TestPluginManifestFields:
     """Validate plugin.json required fields."""
 
-    @pytest.fixture(scope="class")
-    def plugin(self):
-        return load_json(PLUGIN_JSON)
-
-    def test_has_name(self, plugin):
+    def test_has_name(self, plugin_data):
         """plugin.json must have a 'name' field."""
-        assert "name" in plugin, "Missing 'name'"
-        assert isinstance(plugin["name"], str) and plugin["name"].strip()
+        assert "name" in plugin_data, "Missing 'name'"
+        assert isinstance(plugin_data["name"], str) and plugin_data["name"].strip()
 
-    def test_has_version(self, plugin):
+    def test_has_version(self, plugin_data):
         """plugin.json must have a 'version' field."""
-        assert "version" in plugin, "Missing 'version'"
+        assert "version" in plugin_data, "Missing 'version'"
 
-    def test_version_is_semver(self, plugin):
+    def test_version_is_semver(self, plugin_data):
         """version must be valid semver."""
-        version = plugin.get("version", "")
+        version = plugin_data.get("version", "")
         assert SEMVER_PATTERN.match(version), (
             f"version '{version}' is not valid semver (expected X.Y.Z)"
         )
 
-    def test_has_commands(self, plugin):
+    def test_has_commands(self, plugin_data):
         """plugin.json may optionally have a 'commands' object (auto-discovery is also supported)."""
         # Commands field is optional since Claude Code auto-discovers from .md files
-        if "commands" in plugin:
-            assert isinstance(plugin["commands"], dict), (
+        if "commands" in plugin_data:
+            assert isinstance(plugin_data["commands"], dict), (
                 "If present, 'commands' must be an object"
             )
 
-    def test_has_description(self, plugin):
+    def test_has_description(self, plugin_data):
         """plugin.json should have a 'description' field."""
-        assert "description" in plugin, "Missing 'description'"
-        assert isinstance(plugin["description"], str) and plugin["description"].strip()
+        assert "description" in plugin_data, "Missing 'description'"
+        assert isinstance(plugin_data["description"], str) and plugin_data["description"].strip()
 
-    def test_has_author(self, plugin):
+    def test_has_author(self, plugin_data):
         """plugin.json should have an 'author' field."""
-        assert "author" in plugin, "Missing 'author'"
+        assert "author" in plugin_data, "Missing 'author'"
 
 
 # ---------------------------------------------------------------------------
@@ -125,51 +136,42 @@ class TestPluginManifestFields:
 class TestPluginManifestCommands:
     """Validate command file structure (auto-discovery via flat .md files)."""
 
-    @pytest.fixture(scope="class")
-    def plugin(self):
-        return load_json(PLUGIN_JSON)
-
-    def test_command_files_exist(self):
+    def test_command_files_exist(self, commands_tree):
         """All 12 expected command .md files must exist in commands/ directory."""
-        commands_dir = FORGE_DIR / "commands"
-        for cmd_name in sorted(EXPECTED_COMMANDS):
-            cmd_file = commands_dir / f"{cmd_name}.md"
-            assert cmd_file.exists(), (
+        for cmd_name in EXPECTED_COMMANDS_SORTED:
+            assert f"{cmd_name}.md" in commands_tree["files"], (
                 f"Command file missing: commands/{cmd_name}.md"
             )
 
-    def test_expected_command_count(self):
+    def test_expected_command_count(self, commands_tree):
         """commands/ directory must contain at least 12 command .md files (excluding index.md)."""
-        commands_dir = FORGE_DIR / "commands"
         cmd_files = [
-            f for f in commands_dir.glob("*.md")
-            if f.name != "index.md"
+            rel for rel in commands_tree["files"]
+            if "/" not in rel and rel.endswith(".md") and rel != "index.md"
         ]
         assert len(cmd_files) >= 12, (
             f"Expected at least 12 command files, found {len(cmd_files)}: "
-            f"{sorted([f.stem for f in cmd_files])}"
+            f"{sorted(cmd_files)}"
         )
 
-    @pytest.mark.parametrize("cmd_name", sorted(EXPECTED_COMMANDS))
-    def test_command_file_has_content(self, cmd_name):
+    def test_command_file_has_content(self, commands_tree):
         """Each command .md file must have YAML frontmatter and content."""
-        cmd_file = FORGE_DIR / "commands" / f"{cmd_name}.md"
-        if not cmd_file.exists():
-            pytest.skip(f"Command file '{cmd_name}.md' not found")
-        
-        content = cmd_file.read_text()
-        # Check for YAML frontmatter (starts and ends with ---)
-        assert content.startswith("---"), (
-            f"Command '{cmd_name}.md' missing YAML frontmatter"
-        )
-        assert content.count("---") >= 2, (
-            f"Command '{cmd_name}.md' has incomplete YAML frontmatter"
-        )
-
-    def test_examples_directory_exists(self):
+        # One test over all commands: per-command parametrization only added
+        # setup/report overhead, and this reports every offender at once.
+        # Missing files are reported by test_command_files_exist.
+        problems: dict[str, list[str]] = {}
+        for cmd_name in EXPECTED_COMMANDS_SORTED:
+            if f"{cmd_name}.md" not in commands_tree["files"]:
+                continue
+            # Check for YAML frontmatter (starts and ends with ---)
+            problem = _frontmatter_problem(COMMANDS_DIR / f"{cmd_name}.md")
+            if problem:
+                problems.setdefault(problem, []).append(f"{cmd_name}.md")
+        assert not problems, pformat(problems)
+
+    def test_examples_directory_exists(self, commands_tree):
         """commands/_docs/ directory should exist for examples."""
-        docs_dir = FORGE_DIR / "commands" / "_docs"
-        assert docs_dir.is_dir(), "commands/_docs/ directory missing"
+        assert "_docs" in commands_tree["dirs"], "commands/_docs/ directory missing"
 
     def test_examples_files_exist(self):
         """Each command should have a corresponding examples file in _docs/."""
@@ -1,62 +1,69 @@
 """Validate Programming Languages skills content and structure."""
 
+import functools
+import os
+import re
 from pathlib import Path
+from typing import NamedTuple
 
 import pytest
 
 from conftest import FORGE_DIR, extract_yaml_frontmatter
 
+# Shares an xdist worker with test_plugin_manifest.py (see there).
+pytestmark = pytest.mark.xdist_group("layer1_fs")
+
 
 SKILL_METADATA = {
     "cpp": {
         "description": "Modern C++ (C++17/20/23) development and best practices",
         "primary_domain": "engineering",
-        "memory_files": {
+        "memory_files": frozenset({
             "project_overview.md",
             "toolchain_profile.md",
             "performance_notes.md",
             "known_issues.md",
-        },
+        }),
     },
     "csharp": {
         "description": "C# language features and .NET ecosystem development",
         "primary_domain": "dotnet",
-        "memory_files": {
+        "memory_files": frozenset({
             "project_overview.md",
             "runtime_stack.md",
             "csharp_conventions.md",
             "known_issues.md",
-        },
+        }),
     },
     "java-architect": {
         "description": "Enterprise Java architecture and design patterns",
         "primary_domain": "engineering",
-        "memory_files": {
+        "memory_files": frozenset({
             "project_overview.md",
             "architecture_decisions.md",
             "framework_stack.md",
             "performance_notes.md",
-        },
+        }),
     },
     "javascript": {
         "description": "Advanced JavaScript patterns, ES2024+, and runtime optimization",
         "primary_domain": "engineering",
-        "memory_files": {
+        "memory_files": frozenset({
             "project_overview.md",
             "runtime_profile.md",
             "module_strategy.md",
             "performance_notes.md",
-        },
+        }),
     },
     "typescript": {
         "description": "TypeScript advanced types, generics, and strict configuration",
         "primary_domain": "engineering",
-        "memory_files": {
+        "memory_files": frozenset({
             "project_overview.md",
             "tsconfig_profile.md",
             "type_patterns.md",
             "migration_notes.md",
-        },
+        }),
     },
 }
 
@@ -69,25 +76,71 @@ WORKFLOW_STEPS = [
     "Update Memory",
 ]
 
+INTERFACE_MARKERS = ("contextProvider", "memoryStore", "/claudedocs/", "OUTPUT_CONVENTIONS")
+
+# One alternation per marker set, so each file is scanned once instead of
+# once per marker
+INTERFACE_RE = re.compile("|".join(re.escape(m) for m in INTERFACE_MARKERS))
+WORKFLOW_RE = re.compile("|".join(re.escape(step.lower()) for step in WORKFLOW_STEPS))
+EXAMPLE_RE = re.compile(r"^## Example", re.MULTILINE)
+
+
+SKILL_PATHS: dict[str, dict[str, Path]] = {
+    skill: {
+        "skill": FORGE_DIR / "skills" / skill / "SKILL.md",
+        "examples": FORGE_DIR / "skills" / skill / "examples.md",
+        "memory_index": FORGE_DIR / "memory" / "skills" / skill / "index.md",
+    }
+    for skill in SKILL_METADATA
+}
+
+
+class SkillArtifacts(NamedTuple):
+    """Everything the tests below check for one skill, loaded together."""
 
-def _skill_path(skill: str) -> Path:
-    return FORGE_DIR / "skills" / skill / "SKILL.md"
+    skill: str
+    frontmatter: dict | None
+    skill_text: str | None
+    examples_text: str
+    memory_index_exists: bool
 
 
-def _examples_path(skill: str) -> Path:
-    return FORGE_DIR / "skills" / skill / "examples.md"
+def _read_or_none(path: Path) -> str | None:
+    try:
+        return path.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return None
 
 
-def _memory_index_path(skill: str) -> Path:
-    return FORGE_DIR / "memory" / "skills" / skill / "index.md"
+@functools.lru_cache(maxsize=None)
+def _load_skill(skill: str) -> SkillArtifacts:
+    """Read and parse a skill's files once, however many tests use them."""
+    paths = SKILL_PATHS[skill]
+    skill_text = _read_or_none(paths["skill"])
+    return SkillArtifacts(
+        skill=skill,
+        frontmatter=None if skill_text is None else extract_yaml_frontmatter(paths["skill"]),
+        skill_text=skill_text,
+        examples_text=_read_or_none(paths["examples"]) or "",
+        memory_index_exists=os.path.isfile(paths["memory_index"]),
+    )
+
+
+@pytest.fixture
+def skill_artifacts(request) -> SkillArtifacts:
+    """Indirectly parametrized with a skill name; see _load_skill."""
+    return _load_skill(request.param)
+
 
+_SKILLS = list(SKILL_METADATA)
 
-@pytest.mark.parametrize("skill", SKILL_METADATA.keys())
-def test_skill_frontmatter(skill):
-    skill_path = _skill_path(skill)
-    assert skill_path.exists(), f"Missing SKILL.md for {skill}"
 
-    frontmatter = extract_yaml_frontmatter(skill_path)
+@pytest.mark.parametrize("skill_artifacts", _SKILLS, indirect=True)
+def test_skill_frontmatter(skill_artifacts):
+    skill = skill_artifacts.skill
+    assert skill_artifacts.skill_text is not None, f"Missing SKILL.md for {skill}"
+
+    frontmatter = skill_artifacts.frontmatter
     assert frontmatter is not None, f"Missing frontmatter for {skill}"
 
     expected = SKILL_METADATA[skill]
@@ -105,32 +158,34 @@ def test_skill_frontmatter(skill):
         None,
     )
     assert skill_scope is not None, f"{skill} missing skill-specific memory scope"
-    assert set(skill_scope.get("files", [])) == expected["memory_files"]
+    assert frozenset(skill_scope.get("files", ())) == expected["memory_files"]
 
 
-@pytest.mark.parametrize("skill", SKILL_METADATA.keys())
-def test_skill_content_has_interfaces_and_output(skill):
-    content = _skill_path(skill).read_text(encoding="utf-8")
-    assert "contextProvider" in content
-    assert "memoryStore" in content
-    assert "/claudedocs/" in content
-    assert "OUTPUT_CONVENTIONS" in content
+@pytest.mark.parametrize("skill_artifacts", _SKILLS, indirect=True)
+def test_skill_content_has_interfaces_and_output(skill_artifacts):
+    found = set(INTERFACE_RE.findall(skill_artifacts.skill_text or ""))
+    missing = [m for m in INTERFACE_MARKERS if m not in found]
+    assert not missing, f"{skill_artifacts.skill} missing: {missing}"
 
 
-@pytest.mark.parametrize("skill", SKILL_METADATA.keys())
-def test_skill_has_mandatory_workflow_steps(skill):
-    content = _skill_path(skill).read_text(encoding="utf-8").lower()
-    for step in WORKFLOW_STEPS:
-        assert step.lower() in content, f"{skill} missing workflow step: {step}"
+@pytest.mark.parametrize("skill_artifacts", _SKILLS, indirect=True)
+def test_skill_has_mandatory_workflow_steps(skill_artifacts):
+    found = set(WORKFLOW_RE.findall((skill_artifacts.skill_text or "").lower()))
+    missing = [step for step in WORKFLOW_STEPS if step.lower() not in found]
+    assert not missing, f"{skill_artifacts.skill} missing workflow steps: {missing}"
 
 
-@pytest.mark.parametrize("skill", SKILL_METADATA.keys())
-def test_examples_have_three_scenarios(skill):
-    examples = _examples_path(skill).read_text(encoding="utf-8")
-    assert examples.count("## Example") >= 3
+@pytest.mark.parametrize("skill_artifacts", _SKILLS, indirect=True)
+def test_examples_have_three_scenarios(skill_artifacts):
+    # Stop scanning at the third heading instead of counting them all
+    hits = EXAMPLE_RE.finditer(skill_artifacts.examples_text)
+    assert sum(1 for _ in zip(range(3), hits)) == 3, (
+        f"{skill_artifacts.skill} examples.md has fewer than 3 '## Example' sections"
+    )
 
 
-@pytest.mark.parametrize("skill", SKILL_METADATA.keys())
-def test_memory_index_exists(skill):
-    memory_index = _memory_index_path(skill)
-    assert memory_index.exists(), f"Missing memory index for {skill}"
+@pytest.mark.parametrize("skill_artifacts", _SKILLS, indirect=True)
+def test_memory_index_exists(skill_artifacts):
+    assert skill_artifacts.memory_index_exists, (
+        f"Missing memory index for {skill_artifacts.skill}"
+    )
@@ -10,13 +10,13 @@ Validates:
 Migrated from .github/workflows/forge-skill-validator.md as part of Phase 2 optimization.
 """
 
+import functools
+import os
 import re
-import sys
 from pathlib import Path
 
 import pytest
 
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 from conftest import FORGE_DIR
 
 
@@ -31,75 +31,96 @@ REQUIRED_SECTIONS = [
     "## Interface References",
 ]
 
+# One pass over SKILL.md finds every required section. Unanchored, like the
+# plain substring checks it replaces.
+REQUIRED_SECTIONS_RE = re.compile("|".join(re.escape(section) for section in REQUIRED_SECTIONS))
+
 # Mandatory Workflow section (case-insensitive check)
 WORKFLOW_SECTION_PATTERN = re.compile(r'##\s+.*workflow', re.IGNORECASE)
 
 # Mandatory workflow steps with flexible matching
-# Allows alternative wordings and variations
+# Allows alternative wordings and variations; compiled once at import
 MANDATORY_WORKFLOW_STEPS = [
-    (r"Initial\s+Analysis|Assess.*Scope|Understand.*Context|Gather.*Input|Gather.*Context|Identify.*Scope|Identify.*Requirements|Identify.*Target|Analyze.*Requirements|Analyze.*Scope", "Step 1: Initial Analysis/Assessment"),
-    (r"Load.*Memory", "Step 2: Load Memory"),
-    (r"Load.*Context", "Step 3: Load Context"),
-    (r"Generate.*Output|Create.*Output|Produce.*Output|Write.*Output", "Step N-1: Generate Output"),
-    (r"Update.*Memory", "Step N: Update Memory"),
+    (re.compile(r"Initial\s+Analysis|Assess.*Scope|Understand.*Context|Gather.*Input|Gather.*Context|Identify.*Scope|Identify.*Requirements|Identify.*Target|Analyze.*Requirements|Analyze.*Scope", re.IGNORECASE), "Step 1: Initial Analysis/Assessment"),
+    (re.compile(r"Load.*Memory", re.IGNORECASE), "Step 2: Load Memory"),
+    (re.compile(r"Load.*Context", re.IGNORECASE), "Step 3: Load Context"),
+    (re.compile(r"Generate.*Output|Create.*Output|Produce.*Output|Write.*Output", re.IGNORECASE), "Step N-1: Generate Output"),
+    (re.compile(r"Update.*Memory", re.IGNORECASE), "Step N: Update Memory"),
 ]
 
 # Patterns that indicate hardcoded paths (bad practice)
 # Exclude: code blocks, file structure sections, and documentation
 HARDCODED_PATH_PATTERNS = [
-    r'(?<!`)(?<!/)forge-plugin/skills/[a-z-]+(?!/)',  # Not in code blocks or paths
-    r'(?<![/`])\./skills/[a-z-]+',  # Relative paths (but not in documentation)
-    r'(?<![/`])\.\./skills/[a-z-]+',  # Parent relative paths
+    re.compile(r'(?<!`)(?<!/)forge-plugin/skills/[a-z-]+(?!/)'),  # Not in code blocks or paths
+    re.compile(r'(?<![/`])\./skills/[a-z-]+'),  # Relative paths (but not in documentation)
+    re.compile(r'(?<![/`])\.\./skills/[a-z-]+'),  # Parent relative paths
 ]
 
+# The patterns above as one alternation, so the isolation check scans once
+HARDCODED_PATH_RE = re.compile("|".join(f"(?:{p.pattern})" for p in HARDCODED_PATH_PATTERNS))
+
+# Stripped before the isolation check: fenced code blocks and the
+# File Structure section are documentation, not instructions
+CODE_BLOCK_RE = re.compile(r'```.*?```', re.DOTALL)
+FILE_STRUCTURE_SECTION_RE = re.compile(r'## File Structure.*?(?=\n## |\Z)', re.DOTALL | re.IGNORECASE)
+
+# Any casing of OUTPUT_CONVENTIONS counts as a reference
+OUTPUT_CONVENTIONS_RE = re.compile(r'output_conventions', re.IGNORECASE)
+
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
-def _get_skill_directories() -> list[tuple[str, Path]]:
-    """Return (skill_name, skill_dir) for all skill directories."""
+@functools.lru_cache(maxsize=1)
+def _get_skill_directories() -> tuple[tuple[str, Path], ...]:
+    """Return (skill_name, skill_dir) for all skill directories, scanning skills/ once."""
     skills_dir = FORGE_DIR / "skills"
-    # Filter out non-directory items and template
-    skill_dirs = [
-        d for d in sorted(skills_dir.iterdir())
-        if d.is_dir() and d.name not in ["SKILL_TEMPLATE.md", "__pycache__"]
-    ]
-    return [(d.name, d) for d in skill_dirs]
+    # Directories only (SKILL_TEMPLATE.md and other files drop out here);
+    # DirEntry.is_dir() reuses the type from the listing
+    with os.scandir(skills_dir) as it:
+        names = sorted(e.name for e in it if e.is_dir() and e.name != "__pycache__")
+    return tuple((name, skills_dir / name) for name in names)
+
+
+# One param per skill; the xdist_group mark keeps every check for a skill on
+# one worker under ``pytest -n auto --dist loadgroup``, so _read_skill_md
+# reads each SKILL.md once per run rather than once per worker.
+_SKILL_PARAMS = [
+    pytest.param(name, path, id=name, marks=pytest.mark.xdist_group(f"skill-{name}"))
+    for name, path in _get_skill_directories()
+]
 
 
+@functools.lru_cache(maxsize=None)
 def _read_skill_md(skill_dir: Path) -> str:
-    """Read SKILL.md content or return empty string if not found."""
-    skill_md = skill_dir / "SKILL.md"
-    if skill_md.exists():
-        return skill_md.read_text(encoding='utf-8')
-    return ""
+    """Read SKILL.md content or return empty string if not found.
+
+    Cached: four checks read the same SKILL.md for each skill.
+    """
+    try:
+        return (skill_dir / "SKILL.md").read_text(encoding='utf-8')
+    except OSError:
+        # Missing, or a directory in its place; test_skill_has_skill_md reports it
+        return ""
 
 
 # ---------------------------------------------------------------------------
 # Test Class
 # ---------------------------------------------------------------------------
 
+# Applied once to the class: every check runs for every skill.
+@pytest.mark.parametrize("skill_name,skill_dir", _SKILL_PARAMS)
 class TestSkillValidation:
     """Validate skill structure per forge-skill-validator.md checks."""
 
-    @pytest.mark.parametrize(
-        "skill_name,skill_dir",
-        _get_skill_directories(),
-        ids=[name for name, _ in _get_skill_directories()],
-    )
     def test_skill_has_skill_md(self, skill_name, skill_dir):
         """All skill directories must have SKILL.md."""
         skill_md = skill_dir / "SKILL.md"
-        assert skill_md.exists(), (
+        assert skill_md.is_file(), (
             f"Skill '{skill_name}' missing SKILL.md file"
         )
 
-    @pytest.mark.parametrize(
-        "skill_name,skill_dir",
-        _get_skill_directories(),
-        ids=[name for name, _ in _get_skill_directories()],
-    )
     def test_skill_template_compliance(self, skill_name, skill_dir):
         """Check 1: SKILL.md contains required template sections."""
         content = _read_skill_md(skill_dir)
@@ -107,10 +128,8 @@ class TestSkillValidation:
         if not content:
             pytest.skip(f"Skill '{skill_name}' has no SKILL.md")
         
-        missing_sections = []
-        for section in REQUIRED_SECTIONS:
-            if section not in content:
-                missing_sections.append(section)
+        found = set(REQUIRED_SECTIONS_RE.findall(content))
+        missing_sections = [section for section in REQUIRED_SECTIONS if section not in found]
         
         # Check for Mandatory Workflow section (case-insensitive)
         if not WORKFLOW_SECTION_PATTERN.search(content):
@@ -121,11 +140,6 @@ class TestSkillValidation:
             "\n  ".join(missing_sections)
         )
 
-    @pytest.mark.parametrize(
-        "skill_name,skill_dir",
-        _get_skill_directories(),
-        ids=[name for name, _ in _get_skill_directories()],
-    )
     def test_skill_mandatory_workflow_steps(self, skill_name, skill_dir):
         """Check 2: Skill follows mandatory workflow steps (allows reasonable alternatives)."""
         content = _read_skill_md(skill_dir)
@@ -135,7 +149,7 @@ class TestSkillValidation:
         
         missing_steps = []
         for step_pattern, step_name in MANDATORY_WORKFLOW_STEPS:
-            if not re.search(step_pattern, content, re.IGNORECASE):
+            if not step_pattern.search(content):
                 missing_steps.append(step_name)
         
         assert not missing_steps, (
@@ -145,23 +159,13 @@ class TestSkillValidation:
             "\n(Alternative wordings accepted for step 1 and N-1)"
         )
 
-    @pytest.mark.parametrize(
-        "skill_name,skill_dir",
-        _get_skill_directories(),
-        ids=[name for name, _ in _get_skill_directories()],
-    )
     def test_skill_has_examples(self, skill_name, skill_dir):
         """Check 3: Directory includes examples.md."""
         examples_md = skill_dir / "examples.md"
-        assert examples_md.exists(), (
+        assert examples_md.is_file(), (
             f"Skill '{skill_name}' missing examples.md file"
         )
 
-    @pytest.mark.parametrize(
-        "skill_name,skill_dir",
-        _get_skill_directories(),
-        ids=[name for name, _ in _get_skill_directories()],
-    )
     def test_skill_isolation(self, skill_name, skill_dir):
         """Check 4: No hardcoded references to other skills or filesystem paths in code/instructions."""
         content = _read_skill_md(skill_dir)
@@ -170,21 +174,12 @@ class TestSkillValidation:
             pytest.skip(f"Skill '{skill_name}' has no SKILL.md")
         
         # Remove code blocks to avoid false positives
-        content_no_code = re.sub(r'```.*?```', '', content, flags=re.DOTALL)
+        content_no_code = CODE_BLOCK_RE.sub('', content)
         
         # Remove File Structure section (documentation is OK)
-        content_no_code = re.sub(
-            r'## File Structure.*?(?=\n## |\Z)',
-            '',
-            content_no_code,
-            flags=re.DOTALL | re.IGNORECASE
-        )
+        content_no_code = FILE_STRUCTURE_SECTION_RE.sub('', content_no_code)
         
-        violations = []
-        for pattern in HARDCODED_PATH_PATTERNS:
-            matches = re.findall(pattern, content_no_code)
-            if matches:
-                violations.extend(matches)
+        violations = HARDCODED_PATH_RE.findall(content_no_code)
         
         assert not violations, (
             f"Skill '{skill_name}' contains hardcoded paths (violates skill isolation):\n  " +
@@ -192,11 +187,6 @@ class TestSkillValidation:
             "\n\nUse interface references instead (e.g., contextProvider.load(), skillInvoker.invoke())"
         )
 
-    @pytest.mark.parametrize(
-        "skill_name,skill_dir",
-        _get_skill_directories(),
-        ids=[name for name, _ in _get_skill_directories()],
-    )
     def test_skill_output_conventions_reference(self, skill_name, skill_dir):
         """Check 5: References OUTPUT_CONVENTIONS.md where output format is defined."""
         content = _read_skill_md(skill_dir)
@@ -206,7 +196,7 @@ class TestSkillValidation:
         
         # Check if skill defines output format
         has_output_section = "## Output Format" in content
-        references_conventions = "OUTPUT_CONVENTIONS" in content or "output_conventions" in content.lower()
+        references_conventions = OUTPUT_CONVENTIONS_RE.search(content) is not None
         
         if has_output_section and "/claudedocs/" in content:
             # If skill outputs to /claudedocs/, it should reference OUTPUT_CONVENTIONS
@@ -13,27 +13,32 @@ Validates:
 Phase 2 of the Forge Testing Architecture.
 """
 
+import functools
+import posixpath
+import re
 import sys
 from pathlib import Path
 
 import pytest
 
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
-from conftest import FORGE_DIR, extract_yaml_frontmatter, load_json
+from conftest import FORGE_DIR, extract_yaml_frontmatter, scan_tree
 
 
 # ---------------------------------------------------------------------------
 # Constants
 # ---------------------------------------------------------------------------
 
-VALID_DOMAINS = {
+VALID_DOMAINS = frozenset({
     "engineering", "angular", "azure", "commands",
     "dotnet", "git", "python", "schema", "security",
-}
+})
 
-VALID_TYPES = {"always", "framework", "reference", "pattern", "index", "detection"}
+VALID_TYPES = frozenset({"always", "framework", "reference", "pattern", "index", "detection"})
 
-VALID_LOADING_STRATEGIES = {"always", "onDemand", "lazy"}
+VALID_LOADING_STRATEGIES = frozenset({"always", "onDemand", "lazy"})
+
+ID_PATTERN = re.compile(r"^[a-z]+/[a-z_]+$")
 
 CONTEXT_DIR = FORGE_DIR / "context"
 
@@ -43,34 +48,44 @@ CONTEXT_DIR = FORGE_DIR / "context"
 # ---------------------------------------------------------------------------
 
 
+@functools.lru_cache(maxsize=1)
+def _context_md_parts() -> tuple[tuple[str, ...], ...]:
+    """Path parts of every .md file under context/, from a single scan_tree() walk.
+
+    Sorted by parts, which matches the order sorted() gives the Path objects.
+    """
+    files = scan_tree(CONTEXT_DIR)["files"]
+    return tuple(sorted(tuple(rel.split("/")) for rel in files if rel.endswith(".md")))
+
+
 def _get_context_files() -> list[tuple[str, Path]]:
     """Return (relative_id, path) for all .md files under context/."""
-    files = sorted(CONTEXT_DIR.rglob("*.md"))
-    return [
-        (str(f.relative_to(CONTEXT_DIR)), f)
-        for f in files
-    ]
+    return [("/".join(parts), CONTEXT_DIR.joinpath(*parts)) for parts in _context_md_parts()]
 
 
 def _get_domain_context_files() -> list[tuple[str, Path]]:
     """Return (relative_id, path) for all .md files inside domain subdirectories."""
-    files = []
-    for domain_dir in sorted(CONTEXT_DIR.iterdir()):
-        if domain_dir.is_dir() and domain_dir.name in VALID_DOMAINS:
-            for f in sorted(domain_dir.rglob("*.md")):
-                files.append((str(f.relative_to(CONTEXT_DIR)), f))
-    return files
+    return [
+        ("/".join(parts), CONTEXT_DIR.joinpath(*parts))
+        for parts in _context_md_parts()
+        if len(parts) > 1 and parts[0] in VALID_DOMAINS
+    ]
 
 
 def _get_index_files() -> list[tuple[str, Path]]:
     """Return (relative_id, path) for all index.md files in domain dirs."""
-    files = []
-    for domain_dir in sorted(CONTEXT_DIR.iterdir()):
-        if domain_dir.is_dir() and domain_dir.name in VALID_DOMAINS:
-            idx = domain_dir / "index.md"
-            if idx.exists():
-                files.append((str(idx.relative_to(CONTEXT_DIR)), idx))
-    return files
+    return [
+        ("/".join(parts), CONTEXT_DIR.joinpath(*parts))
+        for parts in _context_md_parts()
+        if len(parts) == 2 and parts[0] in VALID_DOMAINS and parts[1] == "index.md"
+    ]
+
+
+# Parametrize tables, built once at import rather than per decorator
+_DOMAIN_FILES = _get_domain_context_files()
+_DOMAIN_IDS = [r for r, _ in _DOMAIN_FILES]
+_INDEX_FILES = _get_index_files()
+_INDEX_IDS = [r for r, _ in _INDEX_FILES]
 
 
 # ---------------------------------------------------------------------------
@@ -91,8 +106,8 @@ class TestFrontmatterPresence:
 
     @pytest.mark.parametrize(
         "rel_path,filepath",
-        _get_domain_context_files(),
-        ids=[r for r, _ in _get_domain_context_files()],
+        _DOMAIN_FILES,
+        ids=_DOMAIN_IDS,
     )
     def test_has_frontmatter(self, rel_path, filepath):
         """Every domain context file must have YAML frontmatter."""
@@ -103,167 +118,62 @@ class TestFrontmatterPresence:
 
 
 # ---------------------------------------------------------------------------
-# Required Fields Tests
+# Field Tests
 # ---------------------------------------------------------------------------
 
 
-class TestFrontmatterRequiredFields:
-    """Validate required fields in all domain context files."""
+class TestFrontmatterFields:
+    """Validate required fields, enum values, patterns and domain consistency.
+
+    All field checks for a file run in one test item; every violation found
+    is reported together rather than one item per check.
+    """
 
     REQUIRED_FIELDS = ["id", "domain", "title", "type", "estimatedTokens", "loadingStrategy"]
 
     @pytest.mark.parametrize(
         "rel_path,filepath",
-        _get_domain_context_files(),
-        ids=[r for r, _ in _get_domain_context_files()],
+        _DOMAIN_FILES,
+        ids=_DOMAIN_IDS,
     )
-    def test_has_required_fields(self, rel_path, filepath):
-        """Every context file must have all 6 required frontmatter fields."""
+    def test_frontmatter_fields(self, rel_path, filepath):
+        """Every domain context file must have valid values for the required fields."""
         fm = extract_yaml_frontmatter(filepath)
         if fm is None:
             pytest.skip(f"{rel_path}: No frontmatter (covered by presence test)")
-        missing = [f for f in self.REQUIRED_FIELDS if f not in fm]
-        assert not missing, (
-            f"{rel_path}: Missing required fields: {missing}"
-        )
+        problems = []
 
+        missing = [f for f in self.REQUIRED_FIELDS if f not in fm]
+        if missing:
+            problems.append(f"Missing required fields: {missing}")
 
-# ---------------------------------------------------------------------------
-# Enum Validation Tests
-# ---------------------------------------------------------------------------
-
-
-class TestFrontmatterEnumValues:
-    """Validate enum fields use correct values."""
-
-    @pytest.mark.parametrize(
-        "rel_path,filepath",
-        _get_domain_context_files(),
-        ids=[r for r, _ in _get_domain_context_files()],
-    )
-    def test_domain_enum(self, rel_path, filepath):
-        """domain must be a valid enum value."""
-        fm = extract_yaml_frontmatter(filepath)
-        if fm is None:
-            pytest.skip("No frontmatter")
         domain = fm.get("domain")
-        assert domain in VALID_DOMAINS, (
-            f"{rel_path}: domain '{domain}' not in {VALID_DOMAINS}"
-        )
-
-    @pytest.mark.parametrize(
-        "rel_path,filepath",
-        _get_domain_context_files(),
-        ids=[r for r, _ in _get_domain_context_files()],
-    )
-    def test_type_enum(self, rel_path, filepath):
-        """type must be a valid enum value."""
-        fm = extract_yaml_frontmatter(filepath)
-        if fm is None:
-            pytest.skip("No frontmatter")
+        if domain not in VALID_DOMAINS:
+            problems.append(f"domain '{domain}' not in {sorted(VALID_DOMAINS)}")
         ftype = fm.get("type")
-        assert ftype in VALID_TYPES, (
-            f"{rel_path}: type '{ftype}' not in {VALID_TYPES}"
-        )
-
-    @pytest.mark.parametrize(
-        "rel_path,filepath",
-        _get_domain_context_files(),
-        ids=[r for r, _ in _get_domain_context_files()],
-    )
-    def test_loading_strategy_enum(self, rel_path, filepath):
-        """loadingStrategy must be a valid enum value."""
-        fm = extract_yaml_frontmatter(filepath)
-        if fm is None:
-            pytest.skip("No frontmatter")
+        if ftype not in VALID_TYPES:
+            problems.append(f"type '{ftype}' not in {sorted(VALID_TYPES)}")
         ls = fm.get("loadingStrategy")
-        assert ls in VALID_LOADING_STRATEGIES, (
-            f"{rel_path}: loadingStrategy '{ls}' not in {VALID_LOADING_STRATEGIES}"
-        )
-
-
-# ---------------------------------------------------------------------------
-# Field Value Validation Tests
-# ---------------------------------------------------------------------------
-
-
-class TestFrontmatterFieldValues:
-    """Validate individual field values and patterns."""
-
-    @pytest.mark.parametrize(
-        "rel_path,filepath",
-        _get_domain_context_files(),
-        ids=[r for r, _ in _get_domain_context_files()],
-    )
-    def test_id_pattern(self, rel_path, filepath):
-        """id must match pattern ^[a-z]+/[a-z_]+$."""
-        import re
+        if ls not in VALID_LOADING_STRATEGIES:
+            problems.append(f"loadingStrategy '{ls}' not in {sorted(VALID_LOADING_STRATEGIES)}")
 
-        fm = extract_yaml_frontmatter(filepath)
-        if fm is None:
-            pytest.skip("No frontmatter")
         fid = fm.get("id", "")
-        assert re.match(r"^[a-z]+/[a-z_]+$", fid), (
-            f"{rel_path}: id '{fid}' does not match pattern ^[a-z]+/[a-z_]+$"
-        )
+        if not (isinstance(fid, str) and ID_PATTERN.match(fid)):
+            problems.append(f"id '{fid}' does not match pattern ^[a-z]+/[a-z_]+$")
 
-    @pytest.mark.parametrize(
-        "rel_path,filepath",
-        _get_domain_context_files(),
-        ids=[r for r, _ in _get_domain_context_files()],
-    )
-    def test_estimated_tokens_positive(self, rel_path, filepath):
-        """estimatedTokens must be a positive integer."""
-        fm = extract_yaml_frontmatter(filepath)
-        if fm is None:
-            pytest.skip("No frontmatter")
         tokens = fm.get("estimatedTokens")
-        assert isinstance(tokens, int), (
-            f"{rel_path}: estimatedTokens must be int, got {type(tokens).__name__}"
-        )
-        assert tokens >= 1, (
-            f"{rel_path}: estimatedTokens must be >= 1, got {tokens}"
-        )
-
-    @pytest.mark.parametrize(
-        "rel_path,filepath",
-        _get_domain_context_files(),
-        ids=[r for r, _ in _get_domain_context_files()],
-    )
-    def test_estimated_tokens_reasonable(self, rel_path, filepath):
-        """estimatedTokens should be reasonable (< 10000)."""
-        fm = extract_yaml_frontmatter(filepath)
-        if fm is None:
-            pytest.skip("No frontmatter")
-        tokens = fm.get("estimatedTokens", 0)
-        assert tokens < 10000, (
-            f"{rel_path}: estimatedTokens {tokens} seems unreasonably high (>= 10000)"
-        )
-
+        if not isinstance(tokens, int):
+            problems.append(f"estimatedTokens must be int, got {type(tokens).__name__}")
+        elif tokens < 1:
+            problems.append(f"estimatedTokens must be >= 1, got {tokens}")
+        elif tokens >= 10000:
+            problems.append(f"estimatedTokens {tokens} seems unreasonably high (>= 10000)")
 
-# ---------------------------------------------------------------------------
-# Domain Consistency Tests
-# ---------------------------------------------------------------------------
-
-
-class TestDomainConsistency:
-    """Validate file's domain matches its parent directory."""
-
-    @pytest.mark.parametrize(
-        "rel_path,filepath",
-        _get_domain_context_files(),
-        ids=[r for r, _ in _get_domain_context_files()],
-    )
-    def test_domain_matches_parent_dir(self, rel_path, filepath):
-        """File's domain field must match its parent directory name."""
-        fm = extract_yaml_frontmatter(filepath)
-        if fm is None:
-            pytest.skip("No frontmatter")
-        domain = fm.get("domain")
         parent_dir = filepath.parent.name
-        assert domain == parent_dir, (
-            f"{rel_path}: domain='{domain}' but parent dir is '{parent_dir}'"
-        )
+        if domain != parent_dir:
+            problems.append(f"domain='{domain}' but parent dir is '{parent_dir}'")
+
+        assert not problems, f"{rel_path}:\n  " + "\n  ".join(problems)
 
 
 # ---------------------------------------------------------------------------
@@ -274,29 +184,25 @@ class TestDomainConsistency:
 class TestSchemaCompliance:
     """Validate frontmatter against context_metadata.schema.json."""
 
-    @pytest.fixture(scope="class")
-    def schema(self):
-        return load_json(
-            FORGE_DIR / "interfaces" / "schemas" / "context_metadata.schema.json"
-        )
-
     @pytest.mark.parametrize(
         "rel_path,filepath",
-        _get_domain_context_files(),
-        ids=[r for r, _ in _get_domain_context_files()],
+        _DOMAIN_FILES,
+        ids=_DOMAIN_IDS,
     )
-    def test_frontmatter_validates_schema(self, rel_path, filepath, schema):
+    def test_frontmatter_validates_schema(
+        self, rel_path, filepath, context_metadata_validator
+    ):
         """Frontmatter must validate against context_metadata.schema.json."""
-        from jsonschema import ValidationError, validate
+        from jsonschema.exceptions import best_match
 
         fm = extract_yaml_frontmatter(filepath)
         if fm is None:
             pytest.skip("No frontmatter")
-        try:
-            validate(instance=fm, schema=schema)
-        except ValidationError as e:
+        # best_match picks the same error jsonschema.validate() would raise
+        error = best_match(context_metadata_validator.iter_errors(fm))
+        if error is not None:
             pytest.fail(
-                f"{rel_path}: Schema violation — {e.message}"
+                f"{rel_path}: Schema violation — {error.message}"
             )
 
 
@@ -308,19 +214,18 @@ class TestSchemaCompliance:
 class TestIndexFiles:
     """Validate index files and their indexedFiles references."""
 
-    def test_every_domain_has_index(self):
+    def test_every_domain_has_index(self, context_tree):
         """Every domain directory must have an index.md."""
-        for domain_dir in sorted(CONTEXT_DIR.iterdir()):
-            if domain_dir.is_dir() and domain_dir.name in VALID_DOMAINS:
-                idx = domain_dir / "index.md"
-                assert idx.exists(), (
-                    f"context/{domain_dir.name}/: Missing index.md"
-                )
+        # Top-level directory names never contain "/", so this keeps only domains
+        for domain in sorted(VALID_DOMAINS & context_tree["dirs"]):
+            assert f"{domain}/index.md" in context_tree["files"], (
+                f"context/{domain}/: Missing index.md"
+            )
 
     @pytest.mark.parametrize(
         "rel_path,filepath",
-        _get_index_files(),
-        ids=[r for r, _ in _get_index_files()],
+        _INDEX_FILES,
+        ids=_INDEX_IDS,
     )
     def test_index_has_indexed_files(self, rel_path, filepath):
         """Index files should have indexedFiles array."""
@@ -339,28 +244,35 @@ class TestIndexFiles:
 
     @pytest.mark.parametrize(
         "rel_path,filepath",
-        _get_index_files(),
-        ids=[r for r, _ in _get_index_files()],
+        _INDEX_FILES,
+        ids=_INDEX_IDS,
     )
-    def test_indexed_files_paths_resolve(self, rel_path, filepath):
+    def test_indexed_files_paths_resolve(self, rel_path, filepath, context_tree):
         """All indexedFiles[].path must resolve to existing files."""
         fm = extract_yaml_frontmatter(filepath)
         if fm is None:
             pytest.skip("No frontmatter")
         indexed = fm.get("indexedFiles", [])
         parent_dir = filepath.parent
+        index_dir = posixpath.dirname(rel_path)
         for entry in indexed:
             path = entry.get("path", "")
             resolved = parent_dir / path
-            assert resolved.exists(), (
+            # Set lookup in the context/ snapshot; stat only paths that leave context/
+            target = posixpath.normpath(posixpath.join(index_dir, path))
+            if target.partition("/")[0] == "..":
+                exists = resolved.exists()
+            else:
+                exists = target in context_tree["files"] or target in context_tree["dirs"]
+            assert exists, (
                 f"{rel_path}: indexedFiles path '{path}' does not exist "
                 f"(expected at {resolved})"
             )
 
     @pytest.mark.parametrize(
         "rel_path,filepath",
-        _get_index_files(),
-        ids=[r for r, _ in _get_index_files()],
+        _INDEX_FILES,
+        ids=_INDEX_IDS,
     )
     def test_indexed_files_have_required_fields(self, rel_path, filepath):
         """Each indexedFiles entry must have id, path, type, loadingStrategy."""
@@ -11,6 +11,7 @@ Also validates the cross_domain.md matrix entries themselves:
   - Format is consistent
 """
 
+import functools
 import re
 from pathlib import Path
 
@@ -39,20 +40,24 @@ KNOWN_DOMAINS = [
 TRIGGER_PATTERN = re.compile(r"^[a-z]+/[a-z_]+$")
 
 
-def _get_agent_configs() -> list[tuple[str, dict]]:
-    """Return (name, config) for all agent config.json files."""
-    configs = []
-    for cfg_file in AGENTS_DIR.glob("*.config.json"):
-        try:
-            config = load_json(cfg_file)
-            configs.append((cfg_file.stem.replace(".config", ""), config))
-        except Exception:
-            continue
-    return configs
+def _load_agent_config(cfg_file: Path) -> tuple[str, dict] | None:
+    """Return (name, config) for one agent config, or None if it cannot be loaded."""
+    try:
+        return cfg_file.stem.replace(".config", ""), load_json(cfg_file)
+    except Exception:
+        return None
 
 
-def _collect_cross_domain_triggers() -> list[tuple[str, str]]:
-    """Collect all (agent_name, trigger) pairs from agent configs."""
+@functools.lru_cache(maxsize=1)
+def _get_agent_configs() -> tuple[tuple[str, dict], ...]:
+    """Return (name, config) for all agent config.json files, loaded once."""
+    results = (_load_agent_config(f) for f in AGENTS_DIR.glob("*.config.json"))
+    return tuple(r for r in results if r is not None)
+
+
+@functools.lru_cache(maxsize=1)
+def _collect_cross_domain_triggers() -> tuple[tuple[str, str], ...]:
+    """Collect all (agent_name, trigger) pairs from agent configs, once."""
     triggers = []
     for name, config in _get_agent_configs():
         context = config.get("context", {})
@@ -65,7 +70,7 @@ def _collect_cross_domain_triggers() -> list[tuple[str, str]]:
                 target = trigger.get("target", trigger.get("file", ""))
                 if target:
                     triggers.append((name, target))
-    return triggers
+    return tuple(triggers)
 
 
 # ── Cross-domain trigger format ──────────────────────────────────────
@@ -75,12 +80,14 @@ class TestTriggerFormat:
 
     def test_all_triggers_match_pattern(self):
         """Every crossDomainTrigger should match 'domain/filename' format."""
-        invalid = []
-        for agent, trigger in _collect_cross_domain_triggers():
-            if not TRIGGER_PATTERN.match(trigger):
-                invalid.append(f"Agent '{agent}': trigger '{trigger}'")
-        if not _collect_cross_domain_triggers():
+        triggers = _collect_cross_domain_triggers()
+        if not triggers:
             pytest.skip("No cross-domain triggers found in agent configs")
+        invalid = [
+            f"Agent '{agent}': trigger '{trigger}'"
+            for agent, trigger in triggers
+            if not TRIGGER_PATTERN.match(trigger)
+        ]
         assert not invalid, (
             f"Triggers with invalid format (expected 'domain/filename'):\n"
             + "\n".join(f"  - {i}" for i in invalid)
@@ -92,21 +99,22 @@ class TestTriggerFormat:
 class TestTriggerTargetsExist:
     """All cross-domain trigger targets should reference existing files."""
 
-    def test_all_trigger_files_exist(self):
+    def test_all_trigger_files_exist(self, context_tree):
         """Every crossDomainTrigger target should resolve to an existing file."""
+        triggers = _collect_cross_domain_triggers()
+        if not triggers:
+            pytest.skip("No cross-domain triggers found in agent configs")
         missing = []
-        for agent, trigger in _collect_cross_domain_triggers():
+        for agent, trigger in triggers:
             # Trigger format: domain/filename → context/{domain}/{filename}.md
             parts = trigger.split("/")
             if len(parts) == 2:
                 domain, filename = parts
                 target_path = CONTEXT_DIR / domain / f"{filename}.md"
-                if not target_path.exists():
+                if f"{domain}/{filename}.md" not in context_tree["files"]:
                     missing.append(
                         f"Agent '{agent}': {trigger} → {target_path.relative_to(FORGE_DIR)}"
                     )
-        if not _collect_cross_domain_triggers():
-            pytest.skip("No cross-domain triggers found in agent configs")
         assert not missing, (
             f"Triggers referencing non-existent files:\n"
             + "\n".join(f"  - {m}" for m in missing)
@@ -128,14 +136,13 @@ class TestNoSelfReferentialTriggers:
 
             for trigger in cdt:
                 trigger_str = trigger if isinstance(trigger, str) else trigger.get("target", "")
-                parts = trigger_str.split("/")
-                if len(parts) >= 1:
-                    trigger_domain = parts[0]
-                    if trigger_domain in primary_domains:
-                        self_refs.append(
-                            f"Agent '{name}': primary domain '{trigger_domain}' "
-                            f"in crossDomainTrigger '{trigger_str}'"
-                        )
+                # Domain is everything before the first "/" (the whole string if none)
+                trigger_domain = trigger_str.partition("/")[0]
+                if trigger_domain in primary_domains:
+                    self_refs.append(
+                        f"Agent '{name}': primary domain '{trigger_domain}' "
+                        f"in crossDomainTrigger '{trigger_str}'"
+                    )
         if not self_refs:
             return  # No self-refs found — pass
         assert not self_refs, (
@@ -169,11 +176,9 @@ class TestNoCircularTriggers:
 
             for trigger in cdt:
                 trigger_str = trigger if isinstance(trigger, str) else trigger.get("target", "")
-                parts = trigger_str.split("/")
-                if len(parts) >= 1:
-                    triggered_domain = parts[0]
-                    for pd in primary_domains:
-                        domain_triggers.setdefault(pd, set()).add(triggered_domain)
+                triggered_domain = trigger_str.partition("/")[0]
+                for pd in primary_domains:
+                    domain_triggers.setdefault(pd, set()).add(triggered_domain)
 
         # Check for 2-cycle: A triggers B and B triggers A
         cycles = []
@@ -232,7 +237,7 @@ class TestIndexCrossDomainTriggers:
     """Index files may reference cross-domain triggers; verify those targets."""
 
     @pytest.mark.parametrize("domain", KNOWN_DOMAINS)
-    def test_index_cross_domain_references(self, domain):
+    def test_index_cross_domain_references(self, domain, context_tree):
         """Any crossDomainTriggers in {domain}/index.md should target existing files."""
         index_path = CONTEXT_DIR / domain / "index.md"
         if not index_path.exists():
@@ -252,7 +257,7 @@ class TestIndexCrossDomainTriggers:
             if len(parts) == 2:
                 target_domain, target_file = parts
                 target_path = CONTEXT_DIR / target_domain / f"{target_file}.md"
-                if not target_path.exists():
+                if f"{target_domain}/{target_file}.md" not in context_tree["files"]:
                     missing.append(f"{trigger_str} → {target_path.relative_to(FORGE_DIR)}")
 
         assert not missing, (
@@ -11,6 +11,7 @@ These tests validate the *specification* rather than hook behaviour,
 checking that all context files conform to the protocol requirements.
 """
 
+import functools
 from pathlib import Path
 
 import pytest
@@ -41,24 +42,41 @@ SPECIAL_FILES = {"cross_domain.md", "loading_protocol.md", "index.md"}
 FRONTMATTER_EXEMPT = {"cross_domain.md", "loading_protocol.md"}
 
 
-def _get_domain_dirs() -> list[Path]:
+@functools.lru_cache(maxsize=1)
+def _get_domain_dirs() -> tuple[Path, ...]:
     """Return all domain subdirectories in context/."""
-    return [
+    return tuple(
         d
-        for d in CONTEXT_DIR.iterdir()
+        for d in sorted(CONTEXT_DIR.iterdir())
         if d.is_dir() and not d.name.startswith(".")
-    ]
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def _get_domain_files_frontmatter() -> tuple[tuple[Path, dict | None], ...]:
+    """Return (path, frontmatter or None) for every .md directly in a domain dir.
+
+    Cached: the checks below all scan the same files, so each is globbed and
+    parsed once per run.
+    """
+    return tuple(
+        (md_file, extract_yaml_frontmatter(md_file))
+        for domain_dir in _get_domain_dirs()
+        for md_file in sorted(domain_dir.glob("*.md"))
+    )
 
 
 def _get_context_files_with_frontmatter() -> list[tuple[Path, dict]]:
     """Return (path, frontmatter) for all context .md files with valid frontmatter."""
-    results = []
-    for domain_dir in _get_domain_dirs():
-        for md_file in domain_dir.glob("*.md"):
-            fm = extract_yaml_frontmatter(md_file)
-            if fm:
-                results.append((md_file, fm))
-    return results
+    return [(path, fm) for path, fm in _get_domain_files_frontmatter() if fm]
+
+
+# Parametrize tables, built once at import: one test item per context file.
+# Sorted above so every pytest-xdist worker collects the same order.
+DOMAIN_FILES = _get_domain_files_frontmatter()
+DOMAIN_FILE_IDS = [str(path.relative_to(CONTEXT_DIR)) for path, _ in DOMAIN_FILES]
+ALL_CONTEXT_FILES = _get_context_files_with_frontmatter()
+ALL_CONTEXT_FILE_IDS = [str(path.relative_to(CONTEXT_DIR)) for path, _ in ALL_CONTEXT_FILES]
 
 
 # ── Step 1: Every domain has index.md ────────────────────────────────
@@ -156,19 +174,14 @@ class TestAlwaysLoadFiles:
 
     VALID_ALWAYS_TYPES = {"always", "index", "detection", "reference"}
 
-    def test_always_load_files_have_valid_types(self):
-        """All files with loadingStrategy=always must have valid types."""
-        invalid = []
-        for path, fm in _get_context_files_with_frontmatter():
-            if fm.get("loadingStrategy") == "always":
-                file_type = fm.get("type", "")
-                if file_type not in self.VALID_ALWAYS_TYPES:
-                    invalid.append(
-                        f"{path.relative_to(FORGE_DIR)}: type={file_type}"
-                    )
-        assert not invalid, (
-            f"Files with loadingStrategy=always have invalid types:\n"
-            + "\n".join(f"  - {f}" for f in invalid)
+    @pytest.mark.parametrize("path,fm", ALL_CONTEXT_FILES, ids=ALL_CONTEXT_FILE_IDS)
+    def test_always_load_file_has_valid_type(self, path, fm):
+        """A file with loadingStrategy=always must have a valid type."""
+        if fm.get("loadingStrategy") != "always":
+            return
+        file_type = fm.get("type", "")
+        assert file_type in self.VALID_ALWAYS_TYPES, (
+            f"{path.relative_to(FORGE_DIR)}: loadingStrategy=always with invalid type={file_type}"
         )
 
 
@@ -177,51 +190,37 @@ class TestAlwaysLoadFiles:
 class TestEstimatedTokens:
     """estimatedTokens should be reasonable: > 0 and < 10000."""
 
-    def test_all_estimated_tokens_positive(self):
+    @pytest.mark.parametrize("path,fm", ALL_CONTEXT_FILES, ids=ALL_CONTEXT_FILE_IDS)
+    def test_estimated_tokens_positive(self, path, fm):
         """estimatedTokens must be a positive integer."""
-        violations = []
-        for path, fm in _get_context_files_with_frontmatter():
-            tokens = fm.get("estimatedTokens")
-            if tokens is not None:
-                if not isinstance(tokens, int) or tokens < 1:
-                    violations.append(
-                        f"{path.relative_to(FORGE_DIR)}: estimatedTokens={tokens}"
-                    )
-        assert not violations, (
-            f"Files with invalid estimatedTokens:\n"
-            + "\n".join(f"  - {v}" for v in violations)
-        )
+        tokens = fm.get("estimatedTokens")
+        if tokens is not None:
+            assert isinstance(tokens, int) and tokens >= 1, (
+                f"{path.relative_to(FORGE_DIR)}: invalid estimatedTokens={tokens}"
+            )
 
-    def test_all_estimated_tokens_under_10000(self):
+    @pytest.mark.parametrize("path,fm", ALL_CONTEXT_FILES, ids=ALL_CONTEXT_FILE_IDS)
+    def test_estimated_tokens_under_10000(self, path, fm):
         """estimatedTokens should be < 10000 (no single file that large)."""
-        violations = []
-        for path, fm in _get_context_files_with_frontmatter():
-            tokens = fm.get("estimatedTokens")
-            if tokens is not None and isinstance(tokens, int) and tokens >= 10000:
-                violations.append(
-                    f"{path.relative_to(FORGE_DIR)}: estimatedTokens={tokens}"
-                )
-        assert not violations, (
-            f"Files with unreasonably large estimatedTokens:\n"
-            + "\n".join(f"  - {v}" for v in violations)
-        )
+        tokens = fm.get("estimatedTokens")
+        if tokens is not None and isinstance(tokens, int):
+            assert tokens < 10000, (
+                f"{path.relative_to(FORGE_DIR)}: unreasonably large estimatedTokens={tokens}"
+            )
 
-    def test_section_tokens_positive(self):
+    @pytest.mark.parametrize("path,fm", ALL_CONTEXT_FILES, ids=ALL_CONTEXT_FILE_IDS)
+    def test_section_tokens_positive(self, path, fm):
         """Section-level estimatedTokens should also be positive."""
         violations = []
-        for path, fm in _get_context_files_with_frontmatter():
-            sections = fm.get("sections", [])
-            for section in sections:
-                tokens = section.get("estimatedTokens")
-                if tokens is not None:
-                    if not isinstance(tokens, int) or tokens < 1:
-                        violations.append(
-                            f"{path.relative_to(FORGE_DIR)} section "
-                            f"'{section.get('name', '?')}': "
-                            f"estimatedTokens={tokens}"
-                        )
+        for section in fm.get("sections", []):
+            tokens = section.get("estimatedTokens")
+            if tokens is not None:
+                if not isinstance(tokens, int) or tokens < 1:
+                    violations.append(
+                        f"section '{section.get('name', '?')}': estimatedTokens={tokens}"
+                    )
         assert not violations, (
-            f"Sections with invalid estimatedTokens:\n"
+            f"{path.relative_to(FORGE_DIR)} sections with invalid estimatedTokens:\n"
             + "\n".join(f"  - {v}" for v in violations)
         )
 
@@ -231,20 +230,14 @@ class TestEstimatedTokens:
 class TestDomainConsistency:
     """File's domain field must match its parent directory name."""
 
-    def test_domain_matches_parent_dir(self):
-        """Every context file's 'domain' field should match its directory name."""
-        mismatches = []
-        for path, fm in _get_context_files_with_frontmatter():
-            file_domain = fm.get("domain", "")
-            parent_dir = path.parent.name
-            if file_domain != parent_dir:
-                mismatches.append(
-                    f"{path.relative_to(FORGE_DIR)}: domain='{file_domain}' "
-                    f"but parent dir='{parent_dir}'"
-                )
-        assert not mismatches, (
-            f"Domain field mismatches:\n"
-            + "\n".join(f"  - {m}" for m in mismatches)
+    @pytest.mark.parametrize("path,fm", ALL_CONTEXT_FILES, ids=ALL_CONTEXT_FILE_IDS)
+    def test_domain_matches_parent_dir(self, path, fm):
+        """A context file's 'domain' field should match its directory name."""
+        file_domain = fm.get("domain", "")
+        parent_dir = path.parent.name
+        assert file_domain == parent_dir, (
+            f"{path.relative_to(FORGE_DIR)}: domain='{file_domain}' "
+            f"but parent dir='{parent_dir}'"
         )
 
 
@@ -255,20 +248,14 @@ class TestLoadingStrategyEnum:
 
     VALID_STRATEGIES = {"always", "onDemand", "lazy"}
 
-    def test_all_loading_strategies_valid(self):
-        """Every file's loadingStrategy should be in the allowed enum."""
-        invalid = []
-        for path, fm in _get_context_files_with_frontmatter():
-            strategy = fm.get("loadingStrategy", "")
-            if strategy and strategy not in self.VALID_STRATEGIES:
-                invalid.append(
-                    f"{path.relative_to(FORGE_DIR)}: "
-                    f"loadingStrategy='{strategy}'"
-                )
-        assert not invalid, (
-            f"Files with invalid loadingStrategy:\n"
-            + "\n".join(f"  - {i}" for i in invalid)
-        )
+    @pytest.mark.parametrize("path,fm", ALL_CONTEXT_FILES, ids=ALL_CONTEXT_FILE_IDS)
+    def test_loading_strategy_valid(self, path, fm):
+        """A file's loadingStrategy should be in the allowed enum."""
+        strategy = fm.get("loadingStrategy", "")
+        if strategy:
+            assert strategy in self.VALID_STRATEGIES, (
+                f"{path.relative_to(FORGE_DIR)}: invalid loadingStrategy='{strategy}'"
+            )
 
 
 # ── All context files have required frontmatter fields ───────────────
@@ -278,25 +265,13 @@ class TestRequiredFrontmatterFields:
 
     REQUIRED_FIELDS = ["id", "domain", "title", "type", "estimatedTokens", "loadingStrategy"]
 
-    def test_all_context_files_have_required_fields(self):
-        """Every context .md file should have all required frontmatter fields."""
-        missing_fields = []
-        for domain_dir in _get_domain_dirs():
-            for md_file in domain_dir.glob("*.md"):
-                fm = extract_yaml_frontmatter(md_file)
-                if fm is None:
-                    missing_fields.append(
-                        f"{md_file.relative_to(FORGE_DIR)}: NO frontmatter"
-                    )
-                    continue
-                for field in self.REQUIRED_FIELDS:
-                    if field not in fm:
-                        missing_fields.append(
-                            f"{md_file.relative_to(FORGE_DIR)}: missing '{field}'"
-                        )
-        assert not missing_fields, (
-            f"Context files with missing required fields:\n"
-            + "\n".join(f"  - {m}" for m in missing_fields)
+    @pytest.mark.parametrize("md_file,fm", DOMAIN_FILES, ids=DOMAIN_FILE_IDS)
+    def test_context_file_has_required_fields(self, md_file, fm):
+        """A context .md file should have all required frontmatter fields."""
+        assert fm is not None, f"{md_file.relative_to(FORGE_DIR)}: NO frontmatter"
+        missing = [field for field in self.REQUIRED_FIELDS if field not in fm]
+        assert not missing, (
+            f"{md_file.relative_to(FORGE_DIR)}: missing required fields {missing}"
         )
 
 
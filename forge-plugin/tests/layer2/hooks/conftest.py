@@ -26,13 +26,21 @@ def hook_runner():
     return _make
 
 
+@pytest.fixture(scope="session")
+def git_template(tmp_path_factory) -> Path:
+    """A ``.forge/`` + initialized git repo, built once and copied per test."""
+    return TempForgeEnvironment.build_template(
+        tmp_path_factory.mktemp("forge_git_template")
+    )
+
+
 @pytest.fixture
-def temp_forge_env():
+def temp_forge_env(git_template):
     """Factory fixture that creates a TempForgeEnvironment."""
     envs = []
 
     def _make(init_git: bool = False) -> TempForgeEnvironment:
-        env = TempForgeEnvironment(init_git=init_git)
+        env = TempForgeEnvironment(init_git=init_git, template=git_template)
         env.__enter__()
         envs.append(env)
         return env
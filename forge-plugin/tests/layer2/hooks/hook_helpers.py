@@ -13,10 +13,18 @@ Provides:
 
 import json
 import os
+import shutil
 import subprocess
 import tempfile
 from pathlib import Path
 
+# orjson, when installed, parses hook output several times faster; its decode
+# error subclasses json.JSONDecodeError, so callers handle both the same way
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
 
 # ── Resolve paths ──────────────────────────────────────────────────────────
 
@@ -65,7 +73,7 @@ class HookResult:
             stripped = self.stdout.strip()
             if stripped:
                 try:
-                    self._json_output = json.loads(stripped)
+                    self._json_output = _json_loads(stripped)
                 except (json.JSONDecodeError, ValueError):
                     self._json_output = None
         return self._json_output
@@ -166,6 +174,9 @@ class HookRunner:
         work_dir = str(cwd) if cwd else str(REPO_ROOT)
 
         try:
+            # One bash per run: scripts exit, set traps and read stdin to EOF,
+            # so sourcing them into a long-lived shell would leak state
+            # between tests.
             proc = subprocess.run(
                 ["bash", str(self.script_path)],
                 input=stdin_data,
@@ -190,6 +201,9 @@ class TempForgeEnvironment:
     - Optional .git/ directory for git-dependent hooks
     - Configurable staged files for pre-commit hooks
 
+    Pass ``template`` (a directory previously built by ``build_template``)
+    to copy a ready-made ``.forge/`` + git repo instead of re-running git.
+
     Usage::
 
         with TempForgeEnvironment() as env:
@@ -197,9 +211,10 @@ class TempForgeEnvironment:
             result = runner.run(input_json, cwd=env.project_root)
     """
 
-    def __init__(self, init_git: bool = False):
+    def __init__(self, init_git: bool = False, template: Path | None = None):
         self._tmpdir: tempfile.TemporaryDirectory | None = None
         self._init_git = init_git
+        self._template = template
         self.project_root: Path = Path()
         self.forge_dir: Path = Path()
 
@@ -207,49 +222,71 @@ class TempForgeEnvironment:
         self._tmpdir = tempfile.TemporaryDirectory(prefix="forge_test_")
         self.project_root = Path(self._tmpdir.name)
         self.forge_dir = self.project_root / ".forge"
-        self.forge_dir.mkdir(parents=True)
-
-        # Create health buffer files
-        (self.forge_dir / "health_buffer").touch()
-        (self.forge_dir / "health_buffer.lock").touch()
 
-        if self._init_git:
-            self._setup_git()
+        if self._init_git and self._template is not None:
+            # Plain copies, not hardlinks: hooks append to health_buffer
+            # and git rewrites files in place.
+            shutil.copytree(
+                self._template, self.project_root,
+                symlinks=True, dirs_exist_ok=True,
+            )
+            return self
 
+        self._populate(self.project_root, self._init_git)
         return self
 
+    @classmethod
+    def build_template(cls, root: Path) -> Path:
+        """Build a reusable ``.forge/`` + git repo under *root* and return it."""
+        cls._populate(root, init_git=True)
+        return root
+
+    @classmethod
+    def _populate(cls, root: Path, init_git: bool):
+        """Create the .forge/ runtime files (and git repo) under *root*."""
+        forge_dir = root / ".forge"
+        forge_dir.mkdir(parents=True)
+
+        # Create health buffer files
+        (forge_dir / "health_buffer").touch()
+        (forge_dir / "health_buffer.lock").touch()
+
+        if init_git:
+            cls._setup_git(root)
+
     def __exit__(self, *args):
         if self._tmpdir:
             self._tmpdir.cleanup()
 
-    def _setup_git(self):
+    @staticmethod
+    def _setup_git(project_root: Path):
         """Initialize a minimal git repo in the project root."""
         subprocess.run(
             ["git", "init", "--initial-branch=develop"],
-            cwd=str(self.project_root),
+            cwd=str(project_root),
             capture_output=True,
             text=True,
         )
         subprocess.run(
             ["git", "config", "user.email", "test@forge.dev"],
-            cwd=str(self.project_root),
+            cwd=str(project_root),
             capture_output=True,
         )
         subprocess.run(
             ["git", "config", "user.name", "Forge Test"],
-            cwd=str(self.project_root),
+            cwd=str(project_root),
             capture_output=True,
         )
         # Initial commit so HEAD exists
-        (self.project_root / ".gitkeep").touch()
+        (project_root / ".gitkeep").touch()
         subprocess.run(
             ["git", "add", "."],
-            cwd=str(self.project_root),
+            cwd=str(project_root),
             capture_output=True,
         )
         subprocess.run(
             ["git", "commit", "-m", "chore: initial commit"],
-            cwd=str(self.project_root),
+            cwd=str(project_root),
             capture_output=True,
         )
 